@@ -7,7 +7,7 @@ enabling efficient processing of large datasets with continuous membership degre
 
 # Core classes
 from .fuzzy_set import FuzzySet
-from .fuzzy_eval import fuzzy_eval
+from .fuzzy_eval import fuzzy_eval, compile_fuzzy_query
 
 # Lazy streaming classes
 from .lazy_fuzzy_streams import (
@@ -67,6 +67,7 @@ __all__ = [
     # Core classes
     "FuzzySet",
     "fuzzy_eval",
+    "compile_fuzzy_query",
     
     # Lazy streaming
     "FuzzyLazyStream",
@@ -0,0 +1,147 @@
+"""
+Kernels for the numeric inner loops of query evaluation and fuzzy set
+operations.
+
+The kernels write into a caller-provided `out` array rather than allocating
+temporaries. Some are compiled with Numba when it is installed (`pip install
+fuzzy-logic-search[fast]`); without it `HAVE_NUMBA` is False and callers use
+their NumPy implementations instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover
+    prange = range
+    HAVE_NUMBA = False
+
+
+# Below this many documents, thread start-up outweighs the compiled speedup
+MIN_DOCS = 4096
+
+
+def _max_min_compose(L: np.ndarray,
+                     indptr: np.ndarray,
+                     indices: np.ndarray,
+                     out: np.ndarray) -> None:
+    """
+    Max-min composition of a literal matrix with a clause structure.
+
+    Parameters:
+    -----------
+    L : ndarray, shape (num_docs, num_literals)
+        Degree of membership of each literal in each document.
+    indptr, indices : ndarray of int64
+        Clauses in compressed sparse row form: the literals of clause `c` are
+        the columns `indices[indptr[c]:indptr[c + 1]]` of `L`.
+    out : ndarray, shape (num_docs,)
+        Receives, for each document, the max over clauses of the min over
+        the clause's literals.
+    """
+    num_clauses = len(indptr) - 1
+    for i in prange(L.shape[0]):
+        best = 0.0
+        for c in range(num_clauses):
+            degree = 1.0
+            for k in range(indptr[c], indptr[c + 1]):
+                degree = min(degree, L[i, indices[k]])
+                if degree <= best:
+                    break
+            best = max(best, degree)
+        out[i] = best
+
+
+if HAVE_NUMBA:
+    max_min_compose = njit(_max_min_compose, nogil=True, cache=True,
+                           parallel=True)
+else:  # pragma: no cover
+    max_min_compose = None
+
+
+def _minimum_loop(a, b, out):
+    for i in range(a.size):
+        out[i] = a[i] if a[i] < b[i] else b[i]
+
+
+def _maximum_loop(a, b, out):
+    for i in range(a.size):
+        out[i] = a[i] if a[i] > b[i] else b[i]
+
+
+def _complement_loop(a, out):
+    for i in range(a.size):
+        out[i] = 1.0 - a[i]
+
+
+def _sub_loop(a, b, out):
+    for i in range(a.size):
+        nb = 1.0 - b[i]
+        out[i] = a[i] if a[i] < nb else nb
+
+
+def _xor_loop(a, b, out):
+    for i in range(a.size):
+        ai, bi = a[i], b[i]
+        x = ai if ai < 1.0 - bi else 1.0 - bi
+        y = 1.0 - ai if 1.0 - ai < bi else bi
+        out[i] = x if x > y else y
+
+
+def _np_minimum(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fuzzy intersection `out = min(a, b)`.
+    """
+    np.minimum(a, b, out=out)
+
+
+def _np_maximum(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fuzzy union `out = max(a, b)`.
+    """
+    np.maximum(a, b, out=out)
+
+
+def _np_complement(a: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fuzzy complement `out = 1 - a`.
+    """
+    np.subtract(1.0, a, out=out)
+
+
+def _np_sub(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fuzzy difference `out = min(a, 1 - b)` without temporaries.
+    """
+    np.subtract(1.0, b, out=out)
+    np.minimum(a, out, out=out)
+
+
+def _np_xor(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fuzzy symmetric difference `out = max(min(a, 1 - b), min(1 - a, b))`
+    with a single temporary.
+    """
+    tmp = np.subtract(1.0, a)
+    np.minimum(tmp, b, out=tmp)
+    _np_sub(a, b, out)
+    np.maximum(out, tmp, out=out)
+
+
+# Element-wise fuzzy set operations on 1-d float64 arrays. Compiled, each is
+# one streaming pass with no temporaries; the memberships are validated to
+# be in [0, 1], so fastmath's no-NaN assumption holds.
+if HAVE_NUMBA:
+    _jit = njit(nogil=True, cache=True, fastmath=True)
+    minimum = _jit(_minimum_loop)
+    maximum = _jit(_maximum_loop)
+    complement = _jit(_complement_loop)
+    sub = _jit(_sub_loop)
+    xor = _jit(_xor_loop)
+else:  # pragma: no cover
+    minimum = _np_minimum
+    maximum = _np_maximum
+    complement = _np_complement
+    sub = _np_sub
+    xor = _np_xor
@@ -0,0 +1,53 @@
+"""
+Batch scoring of values against fuzzy categories.
+
+Scores many values (e.g. the ages of all records in a corpus) against a set of
+membership functions at once, one vectorized call per category rather than
+one Python call per value and category.
+"""
+
+import numpy as np
+from typing import Callable, Iterable
+
+
+def score_categories(values: Iterable[float],
+                     *category_fns: Callable[[float], float]) -> np.ndarray:
+    """
+    Computes the degree of membership of each value in each category.
+
+    Parameters:
+    -----------
+    values : iterable of float
+        Input values, e.g. one field of every record
+    *category_fns : callable
+        Membership functions, one per category. Functions from
+        `create_membership_function` are evaluated over all values at once
+        through their callable `vectorized` attribute; any other function is
+        called once per value.
+
+    Returns:
+    --------
+    ndarray, shape (len(category_fns), len(values)) : Membership degrees,
+        one row per category
+
+    Examples:
+    ---------
+    >>> young = create_membership_function('trapezoidal', a=0, b=0, c=25, d=35)
+    >>> old = create_membership_function('sigmoid', a=0.1, c=65)
+    >>> score_categories([20, 45, 70], young, old).argmax(axis=0)
+    array([0, 1, 1])
+    """
+    if isinstance(values, np.ndarray):
+        x = np.ascontiguousarray(values, dtype=np.float64)
+    else:
+        x = np.fromiter(values, dtype=np.float64)
+    scores = np.empty((len(category_fns), len(x)))
+    for row, fn in zip(scores, category_fns):
+        # `vectorized = True` is also used as a flag (see `FuzzyQuery.eval`),
+        # so only a callable attribute is an array version of the function
+        vectorized = getattr(fn, 'vectorized', None)
+        if callable(vectorized):
+            row[:] = vectorized(x)
+        else:
+            row[:] = np.fromiter(map(fn, x.tolist()), dtype=np.float64, count=len(x))
+    return scores
@@ -0,0 +1,375 @@
+import os
+import re
+import mmap
+import logging
+from collections.abc import Mapping
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+
+
+def _decode(data, encoding):
+    """
+    Decode a file's bytes, translating '\r\n' and '\r' line endings to '\n'
+    as reading it in text mode would.
+    """
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_mapped(path, encoding):
+    """
+    Read and decode a file through a read-only memory mapping, which is
+    closed, along with the file, before returning.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _decode(mm[:], encoding)
+
+
+class Document:
+    """
+    A document in a corpus.
+
+    Documents use `__slots__` rather than a per-document dictionary, and their
+    metadata is built on demand from a single `os.stat` result. For
+    compatibility with the dictionaries documents used to be, a document is
+    also a read-only `Mapping` with the keys 'content' and 'metadata', so
+    `doc['content']`, `doc.get('metadata')`, `'content' in doc` and
+    `dict(doc)` still work. Documents compare and hash by identity.
+
+    Attributes:
+        filename (str): The name of the document.
+        path (str): The path the document was loaded from, or None.
+        extension (str): The file extension of the document.
+        content (str): The content of the document. For a large file that
+            was not read when loaded, the file is memory-mapped and decoded
+            on first access, and the result cached.
+        metadata (dict): The metadata of the document. For loaded documents
+            it is built from the file's stat result; for added documents it
+            is the metadata given to `Corpus.add`.
+    """
+    __slots__ = ('filename', 'path', 'extension', 'encoding',
+                 '_st', '_content', '_metadata')
+
+    def __init__(self, filename, content, path=None, extension=None,
+                 st=None, metadata=None, encoding='latin-1'):
+        self.filename = filename
+        self.path = path
+        self.extension = (os.path.splitext(filename)[1]
+                          if extension is None else extension)
+        self.encoding = encoding
+        self._st = st
+        self._content = content
+        self._metadata = metadata
+
+    @property
+    def content(self):
+        if self._content is None and self.path is not None:
+            # Read lazily on first access; no file or mapping stays open
+            # until then
+            self._content = _read_mapped(self.path, self.encoding)
+        return self._content
+
+    @property
+    def metadata(self):
+        if self._metadata is None and self._st is not None:
+            st = self._st
+            self._metadata = {
+                'filename': self.filename,
+                'path': self.path,
+                'size': st.st_size,
+                'extension': self.extension,
+                'created': st.st_ctime,
+                'modified': st.st_mtime,
+                'accessed': st.st_atime,
+                'owner': st.st_uid,
+                'group': st.st_gid,
+                'permissions': st.st_mode
+            }
+        return self._metadata
+
+    @property
+    def size(self):
+        """The size of the document in bytes, or -1 if unknown."""
+        if self._st is not None:
+            return self._st.st_size
+        return (self._metadata or {}).get('size', -1)
+
+    @property
+    def modified(self):
+        """The modification time of the document, or NaN if unknown."""
+        if self._st is not None:
+            return self._st.st_mtime
+        return (self._metadata or {}).get('modified', float('nan'))
+
+    _KEYS = ('content', 'metadata')
+
+    def __getitem__(self, key):
+        if key == 'content':
+            return self.content
+        if key == 'metadata':
+            return self.metadata
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __contains__(self, key):
+        return key in self._KEYS
+
+    def keys(self):
+        return Mapping.keys(self)
+
+    def items(self):
+        return Mapping.items(self)
+
+    def values(self):
+        return Mapping.values(self)
+
+    def get(self, key, default=None):
+        return self[key] if key in self._KEYS else default
+
+    def __repr__(self):
+        return f"Document({self.filename!r})"
+
+
+# Registered rather than subclassed, so documents keep identity equality and
+# stay hashable
+Mapping.register(Document)
+
+
+class Corpus:
+    """
+    A class to represent a corpus of documents.
+
+    The corpus models the concept of a set (of documents) and provides methods
+    for loading documents from a directory, adding and removing documents, and
+    performing set operations on corpora.
+
+    Attributes:
+        corpus (dict): A dictionary containing the documents in the corpus.
+            It is a key-value pair where the key is the filename and the value is
+            a `Document` holding the content and metadata of the document. The
+            metadata of a loaded document has the following structure:
+            ```
+            {
+                'filename': 'filename',
+                'path': 'path',
+                'size': 'size',
+                'extension': 'extension',
+                'created': 'created',
+                'modified': 'modified',
+                'accessed': 'accessed',
+                'owner': 'owner',
+                'group': 'group',
+                'permissions': 'permissions'
+            }
+            ```
+            Files loaded from disk of `mmap_threshold` bytes or more are not
+            read until the document's content is first accessed, at which
+            point the file is memory-mapped, decoded with `encoding` and
+            cached as a `str`. Line endings are translated to '\n', as when
+            reading in text mode.
+        encoding (str): The encoding to use when reading the files in the corpus.
+        regex_ext (str): A regular expression pattern to match the file extensions
+            of the documents to include in the corpus. By default, it matches all
+            file extensions.
+        mmap_threshold (int): Files smaller than this many bytes are read and
+            decoded eagerly; larger files are read lazily.
+
+    """
+    def __init__(self,
+                 encoding='latin-1',
+                 regex_ext='.*',
+                 mmap_threshold=4096):
+        self.corpus = dict()
+        self.regex_ext = regex_ext
+        self.encoding = encoding
+        self.mmap_threshold = mmap_threshold
+
+    @property
+    def regex_ext(self):
+        return self._ext_re.pattern
+
+    @regex_ext.setter
+    def regex_ext(self, pattern):
+        # Compile once here rather than on every file matched in `load`
+        self._ext_re = re.compile(pattern)
+
+    def __len__(self):
+        return len(self.corpus)
+    
+    def __getitem__(self, key):
+        return self.corpus[key]
+    
+    def __iter__(self):
+        return iter(self.corpus)
+    
+    def __contains__(self, key):
+        return key in self.corpus
+    
+    def clear(self):
+        self.corpus.clear()
+
+    def __str__(self):
+        if len(self.corpus) == 0:
+            return "Corpus([])"
+        elif len(self.corpus) <= 5:
+            return f"Corpus({self.corpus.keys()})"
+        else:
+            return f"Corpus({self.corpus.keys()[:3]}...)"
+    
+    def __repr__(self):
+        return f"Corpus({self.corpus})"
+    
+    def __eq__(self, other):
+        return set(self.corpus) == set(other.corpus)
+    
+    def __ne__(self, other):
+        return set(self.corpus) != set(other.corpus)
+    
+    # The set operations take their keys from the key views' set operations,
+    # but iterate the operands so that the result keeps insertion order, and
+    # with it the order of `sizes`, `mtimes` and `where`
+    def __sub__(self, other):
+        keep = self.corpus.keys() - other.corpus.keys()
+        new_corpus = Corpus()
+        new_corpus.corpus = {k: v for k, v in self.corpus.items() if k in keep}
+        return new_corpus
+    
+    def __and__(self, other):
+        keep = self.corpus.keys() & other.corpus.keys()
+        new_corpus = Corpus()
+        new_corpus.corpus = {k: v for k, v in self.corpus.items() if k in keep}
+        return new_corpus
+    
+    def __or__(self, other):
+        new_corpus = Corpus()
+        new_corpus.corpus = {**self.corpus, **other.corpus}
+        return new_corpus
+    
+    def __xor__(self, other):
+        s, o = self.corpus, other.corpus
+        keep = s.keys() ^ o.keys()
+        new_corpus = Corpus()
+        new_corpus.corpus = {k: v for k, v in s.items() if k in keep}
+        new_corpus.corpus.update((k, v) for k, v in o.items() if k in keep)
+        return new_corpus
+    
+    def add(self, filename, content, metadata=None):
+        """
+        Add a document to the corpus.
+
+        Args:
+            filename (str): The name of the document.
+            content (str): The content of the document.
+            metadata (dict, optional): Additional metadata for the document.
+        """
+        if filename in self.corpus:
+            logging.warning('File {} already exists in the corpus. Skipping...'.format(filename))
+        self.corpus[filename] = Document(filename, content, metadata=metadata,
+                                         encoding=self.encoding)
+
+    @property
+    def sizes(self):
+        """
+        The sizes in bytes of the documents, in iteration order, as an int64
+        array. Unknown sizes are -1.
+        """
+        return np.fromiter((doc.size for doc in self.corpus.values()),
+                           dtype=np.int64, count=len(self.corpus))
+
+    @property
+    def mtimes(self):
+        """
+        The modification times of the documents, in iteration order, as a
+        float64 array. Unknown times are NaN.
+        """
+        return np.fromiter((doc.modified for doc in self.corpus.values()),
+                           dtype=np.float64, count=len(self.corpus))
+
+    def where(self, mask):
+        """
+        Select the documents for which a boolean mask is true.
+
+        Args:
+            mask (array-like of bool): One entry per document, in iteration
+                order, e.g. `corpus.sizes > 1 << 20`.
+
+        Returns:
+            Corpus: A new corpus with the selected documents.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self.corpus),):
+            raise ValueError('Mask must have one entry per document.')
+        new_corpus = Corpus(self.encoding, self.regex_ext, self.mmap_threshold)
+        new_corpus.corpus = {k: doc for (k, doc), keep
+                             in zip(self.corpus.items(), mask) if keep}
+        return new_corpus
+
+    def remove(self, filename):
+        """
+        Remove a document from the corpus.
+
+        Args:
+            filename (str): The name of the document to remove.
+        """
+        if filename in self.corpus:
+            del self.corpus[filename]
+        else:
+            logging.warning('File {} not found in the corpus. Skipping...'.format(filename))
+    
+    def clear(self):
+        self.corpus.clear()
+
+    def load(self, path, recursively=True, followlinks=False):
+        """
+        Load a corpus from a directory.
+
+        Args:
+            path (str): The path to the directory containing the corpus files.
+            recursively (bool): Whether to load files recursively from
+                subdirectories (default: True).
+        """
+        for root, _, files in os.walk(path, topdown=recursively,
+                                      followlinks=followlinks):
+            for file in files:
+                ext = os.path.splitext(file)[1]
+                if self._ext_re.match(ext):
+                    full = os.path.join(root, file)
+                    content, st = self._read_content(full)
+                    # Save the file content and stat result in the dictionary
+                    if file in self.corpus:
+                        logging.warning('File {} already exists in the corpus. Skipping...'.format(file))
+                    self.corpus[file] = Document(file, content, path=full,
+                                                 extension=ext, st=st,
+                                                 encoding=self.encoding)
+
+    def _read_content(self, full):
+        """
+        Read a file's content if it is small.
+
+        Small files are decoded immediately. Larger files are left unread, so
+        their pages are only faulted in (and decoded) if the document is
+        actually accessed; no file descriptor is kept open for them.
+
+        Args:
+            full (str): The path to the file.
+
+        Returns:
+            tuple: The decoded content, or None for a large file, and the
+            file's `os.stat_result`.
+        """
+        with open(full, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if st.st_size < self.mmap_threshold:
+                return _decode(f.read(), self.encoding), st
+            return None, st
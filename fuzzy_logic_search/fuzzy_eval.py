@@ -6,9 +6,10 @@ system. It evaluates fuzzy queries on individual documents and returns
 membership degrees.
 """
 
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Union
 import re
 import logging
+import numpy as np
 from .default_preds import default_preds
 from .utils import get_values_by_field_path
 
@@ -30,24 +31,150 @@ NARY_OPS = {
     'or': lambda *args: max(args) if args else 0.0,
 }
 
+# Comparison operators and their aliases
+COMPARISON_OPS = {
+    '==': '==', 'eq?': '==',
+    '!=': '!=', 'neq?': '!=',
+    '>': '>', 'gt?': '>',
+    '<': '<', 'lt?': '<',
+    '>=': '>=', 'gte?': '>=',
+    '<=': '<=', 'lte?': '<=',
+}
 
-def fuzzy_eval(query: Union[List, str, float], doc: Dict) -> float:
+
+def fuzzy_compare_array(op: str, left: np.ndarray, right: float) -> np.ndarray:
     """
-    Evaluate a fuzzy query expression against a single document.
-    
-    This function is the core of the fuzzy logic evaluation system,
-    used by the lazy streaming infrastructure.
-    
+    Vectorized fuzzy comparison of an array of numbers with a constant.
+
+    Computes, for every element of `left`, the same membership degree that
+    `fuzzy_eval` gives the numeric comparison `[op, left, right]`, including
+    its adaptive tolerance of 1% of the larger magnitude.
+
     Args:
-        query: Fuzzy query expression (AST), string, or number
-        doc: JSON document to evaluate against
-        
+        op: A comparison operator or alias (see `COMPARISON_OPS`)
+        left: Array of left operands
+        right: Right operand
+
     Returns:
-        Membership degree in [0, 1]
+        Array of membership degrees in [0, 1]
     """
-    preds = default_preds()
-    
-    def _eval(node: Any, document: Dict) -> float:
+    op = COMPARISON_OPS[op]
+    left = np.asarray(left, dtype=np.float64)
+    eps = 0.01 * np.maximum(np.maximum(np.abs(left), abs(right)), 1.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if op == '==':
+            diff = np.abs(left - right)
+            degrees = np.where(diff <= eps, 1.0 - diff / eps, 0.0)
+        elif op == '!=':
+            diff = np.abs(left - right)
+            degrees = np.where(diff <= eps, diff / eps, 1.0)
+        elif op == '>':
+            degrees = np.where(left > right + eps, 1.0,
+                               np.where(left > right - eps,
+                                        (left - (right - eps)) / (2 * eps), 0.0))
+        elif op == '<':
+            degrees = np.where(left < right - eps, 1.0,
+                               np.where(left < right + eps,
+                                        ((right + eps) - left) / (2 * eps), 0.0))
+        elif op == '>=':
+            degrees = np.where(left >= right - eps, 1.0,
+                               np.where(left >= right - 2 * eps,
+                                        (left - (right - 2 * eps)) / eps, 0.0))
+        else:
+            degrees = np.where(left <= right + eps, 1.0,
+                               np.where(left <= right + 2 * eps,
+                                        ((right + 2 * eps) - left) / eps, 0.0))
+        # An infinite operand makes eps infinite too, and inf / inf is NaN;
+        # fuzzy_eval's final clamp, max(0.0, min(1.0, nan)), gives 1.0 there
+        degrees = np.where(np.isnan(degrees), 1.0, degrees)
+    return np.clip(degrees, 0.0, 1.0)
+
+
+def _compare(op: str, left: Any, right: Any) -> float:
+    """
+    Compares two resolved operands. Numbers are compared fuzzily with an
+    adaptive tolerance; other values crisply.
+    """
+    # Apply comparison directly (with fuzzy tolerance for numeric values)
+    if left is None or right is None:
+        return 0.0
+
+    try:
+        # Apply fuzzy membership functions for numeric comparisons
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            # Fuzzy comparison with tolerance
+            epsilon = 0.01 * max(abs(left), abs(right), 1.0)  # Adaptive tolerance
+
+            if op in ["==", "eq?"]:
+                # Triangular membership for equality
+                diff = abs(left - right)
+                if diff <= epsilon:
+                    return 1.0 - (diff / epsilon)
+                return 0.0
+            elif op in ["!=", "neq?"]:
+                # Inverse of equality
+                diff = abs(left - right)
+                if diff <= epsilon:
+                    return diff / epsilon
+                return 1.0
+            elif op in [">", "gt?"]:
+                # Fuzzy greater than
+                if left > right + epsilon:
+                    return 1.0
+                elif left > right - epsilon:
+                    return (left - (right - epsilon)) / (2 * epsilon)
+                return 0.0
+            elif op in ["<", "lt?"]:
+                # Fuzzy less than
+                if left < right - epsilon:
+                    return 1.0
+                elif left < right + epsilon:
+                    return ((right + epsilon) - left) / (2 * epsilon)
+                return 0.0
+            elif op in [">=", "gte?"]:
+                # Fuzzy greater than or equal
+                if left >= right - epsilon:
+                    return 1.0
+                elif left >= right - 2*epsilon:
+                    return (left - (right - 2*epsilon)) / epsilon
+                return 0.0
+            elif op in ["<=", "lte?"]:
+                # Fuzzy less than or equal
+                if left <= right + epsilon:
+                    return 1.0
+                elif left <= right + 2*epsilon:
+                    return ((right + 2*epsilon) - left) / epsilon
+                return 0.0
+        else:
+            # Crisp comparison for non-numeric values
+            if op in ["==", "eq?"]:
+                return 1.0 if left == right else 0.0
+            elif op in ["!=", "neq?"]:
+                return 1.0 if left != right else 0.0
+            elif op in [">", "gt?"]:
+                return 1.0 if left > right else 0.0
+            elif op in ["<", "lt?"]:
+                return 1.0 if left < right else 0.0
+            elif op in [">=", "gte?"]:
+                return 1.0 if left >= right else 0.0
+            elif op in ["<=", "lte?"]:
+                return 1.0 if left <= right else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+_PREDS = default_preds()
+
+
+def _eval(node: Any, document: Dict) -> float:
+    """
+    Interprets a fuzzy query AST node against a document. The result is not
+    clamped to [0, 1] and errors propagate to the caller.
+    """
+    # Most nodes are plain lists: a single identity check skips the
+    # isinstance chain for them (subclasses still take the slow path)
+    if type(node) is not list:
         # Handle literals
         if isinstance(node, (int, float)):
             return float(node)
@@ -68,202 +195,264 @@ def fuzzy_eval(query: Union[List, str, float], doc: Dict) -> float:
                 return 1.0
         elif not isinstance(node, list):
             return 1.0
-        
-        # Handle list expressions
-        if not node:
-            return 0.0
-            
-        op = node[0]
-        operands = node[1:] if len(node) > 1 else []
-        
-        # Handle field/path operations
-        if op == "field" or op == "path" or op == "@":
-            if not operands:
-                return 0.0
-            field_path = operands[0]
-            if isinstance(field_path, str):
-                if field_path.startswith("@"):
-                    field_path = field_path[1:]
-                values = get_values_by_field_path(document, field_path)
-                
-                if len(operands) > 1:
-                    # Apply predicate to field values
-                    predicate = operands[1]
-                    if not values:
-                        return 0.0
-                    degrees = []
-                    for val in values:
-                        if isinstance(predicate, list):
-                            # Evaluate predicate on value
-                            degree = _eval(predicate, {"value": val})
-                        else:
-                            # Direct comparison
-                            degree = 1.0 if val == predicate else 0.0
-                        degrees.append(degree)
-                    # Use existential quantification (max)
-                    return max(degrees) if degrees else 0.0
-                else:
-                    # Just existence check
-                    return 1.0 if values else 0.0
+
+    # Handle list expressions
+    if not node:
+        return 0.0
+
+    op = node[0]
+    operands = node[1:] if len(node) > 1 else []
+
+    # Handle field/path operations
+    if op == "field" or op == "path" or op == "@":
+        if not operands:
             return 0.0
-        
-        # Handle exists operator
-        elif op in ["exists", "exists?"]:
-            if not operands:
-                return 0.0
-            field_path = operands[0]
-            if isinstance(field_path, str):
-                if field_path.startswith("@") or field_path.startswith(":"):
-                    field_path = field_path[1:]
-                values = get_values_by_field_path(document, field_path)
+        field_path = operands[0]
+        if isinstance(field_path, str):
+            if field_path.startswith("@"):
+                field_path = field_path[1:]
+            values = get_values_by_field_path(document, field_path)
+
+            if len(operands) > 1:
+                # Apply predicate to field values
+                predicate = operands[1]
+                if not values:
+                    return 0.0
+                degrees = []
+                for val in values:
+                    if isinstance(predicate, list):
+                        # Evaluate predicate on value
+                        degree = _eval(predicate, {"value": val})
+                    else:
+                        # Direct comparison
+                        degree = 1.0 if val == predicate else 0.0
+                    degrees.append(degree)
+                # Use existential quantification (max)
+                return max(degrees) if degrees else 0.0
+            else:
+                # Just existence check
                 return 1.0 if values else 0.0
+        return 0.0
+
+    # Handle exists operator
+    elif op in ["exists", "exists?"]:
+        if not operands:
             return 0.0
-        
-        # Handle fuzzy modifiers
-        elif op in UNARY_OPS:
-            if not operands:
-                return 0.0
-            operand_value = _eval(operands[0], document)
-            return UNARY_OPS[op](operand_value)
-        
-        # Handle logical operators
-        elif op in NARY_OPS:
-            if not operands:
-                return 0.0
-            operand_values = [_eval(operand, document) for operand in operands]
-            return NARY_OPS[op](*operand_values)
-        
-        # Handle comparison operators
-        elif op in ["==", "eq?", "!=", "neq?", ">", "gt?", "<", "lt?", ">=", "gte?", "<=", "lte?"]:
-            if len(operands) != 2:
-                return 0.0
-                
-            left = operands[0]
-            right = operands[1]
-            
-            # Extract values if they're field paths
-            if isinstance(left, str) and (left.startswith("@") or left.startswith(":")):
-                field_path = left[1:] if (left.startswith("@") or left.startswith(":")) else left
-                left_values = get_values_by_field_path(document, field_path)
-                left = left_values[0] if left_values else None
-            elif isinstance(left, list):
-                left = _eval(left, document)
-                
-            if isinstance(right, str) and (right.startswith("@") or right.startswith(":")):
-                field_path = right[1:] if (right.startswith("@") or right.startswith(":")) else right
-                right_values = get_values_by_field_path(document, field_path)
-                right = right_values[0] if right_values else None
-            elif isinstance(right, list):
-                right = _eval(right, document)
-            
-            # Apply comparison directly (with fuzzy tolerance for numeric values)
-            if left is None or right is None:
-                return 0.0
-                
-            try:
-                # Apply fuzzy membership functions for numeric comparisons
-                if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                    # Fuzzy comparison with tolerance
-                    epsilon = 0.01 * max(abs(left), abs(right), 1.0)  # Adaptive tolerance
-                    
-                    if op in ["==", "eq?"]:
-                        # Triangular membership for equality
-                        diff = abs(left - right)
-                        if diff <= epsilon:
-                            return 1.0 - (diff / epsilon)
-                        return 0.0
-                    elif op in ["!=", "neq?"]:
-                        # Inverse of equality
-                        diff = abs(left - right)
-                        if diff <= epsilon:
-                            return diff / epsilon
-                        return 1.0
-                    elif op in [">", "gt?"]:
-                        # Fuzzy greater than
-                        if left > right + epsilon:
-                            return 1.0
-                        elif left > right - epsilon:
-                            return (left - (right - epsilon)) / (2 * epsilon)
-                        return 0.0
-                    elif op in ["<", "lt?"]:
-                        # Fuzzy less than
-                        if left < right - epsilon:
-                            return 1.0
-                        elif left < right + epsilon:
-                            return ((right + epsilon) - left) / (2 * epsilon)
-                        return 0.0
-                    elif op in [">=", "gte?"]:
-                        # Fuzzy greater than or equal
-                        if left >= right - epsilon:
-                            return 1.0
-                        elif left >= right - 2*epsilon:
-                            return (left - (right - 2*epsilon)) / epsilon
-                        return 0.0
-                    elif op in ["<=", "lte?"]:
-                        # Fuzzy less than or equal
-                        if left <= right + epsilon:
-                            return 1.0
-                        elif left <= right + 2*epsilon:
-                            return ((right + 2*epsilon) - left) / epsilon
-                        return 0.0
-                else:
-                    # Crisp comparison for non-numeric values
-                    if op in ["==", "eq?"]:
-                        return 1.0 if left == right else 0.0
-                    elif op in ["!=", "neq?"]:
-                        return 1.0 if left != right else 0.0
-                    elif op in [">", "gt?"]:
-                        return 1.0 if left > right else 0.0
-                    elif op in ["<", "lt?"]:
-                        return 1.0 if left < right else 0.0
-                    elif op in [">=", "gte?"]:
-                        return 1.0 if left >= right else 0.0
-                    elif op in ["<=", "lte?"]:
-                        return 1.0 if left <= right else 0.0
-            except (TypeError, ValueError):
-                return 0.0
-        
-        # Handle string predicates
-        elif op in ["contains?", "starts-with?", "ends-with?", "regex?", "in?"]:
-            if op in preds:
-                eval_operands = []
-                for operand in operands:
-                    if isinstance(operand, str) and (operand.startswith("@") or operand.startswith(":")):
-                        values = get_values_by_field_path(document, operand[1:])
-                        eval_operands.append(values[0] if values else "")
-                    elif isinstance(operand, list):
-                        eval_operands.append(_eval(operand, document))
-                    else:
-                        eval_operands.append(operand)
-                try:
-                    return preds[op](eval_operands, document)
-                except:
-                    return 0.0
+        field_path = operands[0]
+        if isinstance(field_path, str):
+            if field_path.startswith("@") or field_path.startswith(":"):
+                field_path = field_path[1:]
+            values = get_values_by_field_path(document, field_path)
+            return 1.0 if values else 0.0
+        return 0.0
+
+    # Handle fuzzy modifiers
+    elif op in UNARY_OPS:
+        if not operands:
             return 0.0
-        
-        # Handle other predicates
-        elif op in preds:
+        operand_value = _eval(operands[0], document)
+        return UNARY_OPS[op](operand_value)
+
+    # Handle logical operators
+    elif op in NARY_OPS:
+        if not operands:
+            return 0.0
+        operand_values = [_eval(operand, document) for operand in operands]
+        return NARY_OPS[op](*operand_values)
+
+    # Handle comparison operators
+    elif op in ["==", "eq?", "!=", "neq?", ">", "gt?", "<", "lt?", ">=", "gte?", "<=", "lte?"]:
+        if len(operands) != 2:
+            return 0.0
+
+        left = operands[0]
+        right = operands[1]
+
+        # Extract values if they're field paths
+        if isinstance(left, str) and (left.startswith("@") or left.startswith(":")):
+            field_path = left[1:] if (left.startswith("@") or left.startswith(":")) else left
+            left_values = get_values_by_field_path(document, field_path)
+            left = left_values[0] if left_values else None
+        elif isinstance(left, list):
+            left = _eval(left, document)
+
+        if isinstance(right, str) and (right.startswith("@") or right.startswith(":")):
+            field_path = right[1:] if (right.startswith("@") or right.startswith(":")) else right
+            right_values = get_values_by_field_path(document, field_path)
+            right = right_values[0] if right_values else None
+        elif isinstance(right, list):
+            right = _eval(right, document)
+
+        return _compare(op, left, right)
+
+    # Handle string predicates
+    elif op in ["contains?", "starts-with?", "ends-with?", "regex?", "in?"]:
+        if op in _PREDS:
             eval_operands = []
             for operand in operands:
                 if isinstance(operand, str) and (operand.startswith("@") or operand.startswith(":")):
                     values = get_values_by_field_path(document, operand[1:])
-                    eval_operands.append(values[0] if values else None)
+                    eval_operands.append(values[0] if values else "")
                 elif isinstance(operand, list):
                     eval_operands.append(_eval(operand, document))
                 else:
                     eval_operands.append(operand)
             try:
-                return preds[op](eval_operands, document)
+                return _PREDS[op](eval_operands, document)
             except:
                 return 0.0
-        
-        # Unknown operator
         return 0.0
+
+    # Handle other predicates
+    elif op in _PREDS:
+        eval_operands = []
+        for operand in operands:
+            if isinstance(operand, str) and (operand.startswith("@") or operand.startswith(":")):
+                values = get_values_by_field_path(document, operand[1:])
+                eval_operands.append(values[0] if values else None)
+            elif isinstance(operand, list):
+                eval_operands.append(_eval(operand, document))
+            else:
+                eval_operands.append(operand)
+        try:
+            return _PREDS[op](eval_operands, document)
+        except:
+            return 0.0
+
+    # Unknown operator
+    return 0.0
+
+
+def fuzzy_eval(query: Union[List, str, float], doc: Dict) -> float:
+    """
+    Evaluate a fuzzy query expression against a single document.
     
+    This function is the core of the fuzzy logic evaluation system,
+    used by the lazy streaming infrastructure.
+    
+    Args:
+        query: Fuzzy query expression (AST), string, or number
+        doc: JSON document to evaluate against
+        
+    Returns:
+        Membership degree in [0, 1]
+    """
     try:
         result = _eval(query, doc)
         # Ensure result is in [0, 1]
         return max(0.0, min(1.0, float(result)))
     except Exception as e:
         logger.debug(f"Error evaluating fuzzy query: {e}")
-        return 0.0
\ No newline at end of file
+        return 0.0
+
+
+# Compiled queries keyed by the repr of their AST
+_COMPILED: Dict[str, Callable[[Dict], float]] = {}
+_MAX_COMPILED = 256
+
+
+def _first(document: Dict, field_path: str) -> Any:
+    """First value at a field path, or None."""
+    values = get_values_by_field_path(document, field_path)
+    return values[0] if values else None
+
+
+def _present(document: Dict, field_path: str) -> float:
+    """1.0 if the field path exists in the document, 0.0 otherwise."""
+    return 1.0 if get_values_by_field_path(document, field_path) else 0.0
+
+
+def _codegen(node: Any, consts: Dict[str, Any]) -> str:
+    """
+    Emits a Python expression in `d` (the document) that computes what
+    `_eval(node, d)` does. Nodes without a specialized translation call back
+    into `_eval`, so the two always agree.
+    """
+    def const(value: Any) -> str:
+        name = f"_c{len(consts)}"
+        consts[name] = value
+        return name
+
+    def operand(value: Any) -> str:
+        # Comparison operands: field paths, sub-expressions or raw literals
+        if isinstance(value, str) and value[:1] in ("@", ":"):
+            return f"_first(d, {const(value[1:])})"
+        if isinstance(value, list):
+            return _codegen(value, consts)
+        return const(value)
+
+    if isinstance(node, (int, float)):
+        return const(float(node))
+    if isinstance(node, str):
+        if node[:1] in ("@", ":"):
+            return f"_present(d, {const(node[1:])})"
+        return "1.0"
+    if not isinstance(node, list):
+        return "1.0"
+    if not node:
+        return "0.0"
+
+    op, operands = node[0], node[1:]
+    if type(op) is str:
+        if op in UNARY_OPS:
+            if not operands:
+                return "0.0"
+            inner = _codegen(operands[0], consts)
+            if op == 'not':
+                return f"(1.0 - {inner})"
+            return f"{const(UNARY_OPS[op])}({inner})"
+        if op in NARY_OPS:
+            if not operands:
+                return "0.0"
+            args = ", ".join(_codegen(operand, consts) for operand in operands)
+            return f"{'min' if op == 'and' else 'max'}(({args},))"
+        if op in COMPARISON_OPS:
+            if len(operands) != 2:
+                return "0.0"
+            return (f"_compare({const(op)}, {operand(operands[0])}, "
+                    f"{operand(operands[1])})")
+    return f"_eval({const(node)}, d)"
+
+
+def compile_fuzzy_query(query: Union[List, str, float]) -> Callable[[Dict], float]:
+    """
+    Compile a fuzzy query expression into a function of a document.
+
+    The AST is translated once into a single Python expression, so logical
+    operators, modifiers and comparisons run without the per-node dispatch
+    of `fuzzy_eval`; other predicates are delegated to the interpreter.
+    Compiled queries are cached by AST.
+
+    Args:
+        query: Fuzzy query expression (AST), string, or number
+
+    Returns:
+        Function mapping a document to the same membership degree in [0, 1]
+        as `fuzzy_eval(query, doc)`
+    """
+    key = repr(query)
+    fn = _COMPILED.get(key)
+    if fn is not None:
+        return fn
+
+    consts: Dict[str, Any] = {}
+    try:
+        src = f"lambda d: {_codegen(query, consts)}"
+        namespace = {"_compare": _compare, "_first": _first,
+                     "_present": _present, "_eval": _eval, **consts}
+        expr = eval(compile(src, "<fuzzy>", "eval"), namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        # Too deeply nested to compile; interpret instead
+        return lambda doc: fuzzy_eval(query, doc)
+
+    def fn(doc: Dict) -> float:
+        try:
+            return max(0.0, min(1.0, float(expr(doc))))
+        except Exception as e:
+            logger.debug(f"Error evaluating fuzzy query: {e}")
+            return 0.0
+
+    if len(_COMPILED) >= _MAX_COMPILED:
+        _COMPILED.clear()
+    _COMPILED[key] = fn
+    return fn
@@ -1,6 +1,311 @@
 import re
-from typing import List, Union, Callable
+import functools
+import numpy as np
+from typing import Any, List, Optional, Tuple, Union, Callable
 from .fuzzy_set import FuzzySet
+from . import _kernels
+
+
+def _freeze(ast: Any) -> Any:
+    """
+    Converts a (list-based) AST into an equivalent hashable tuple-based AST.
+    """
+    if isinstance(ast, list):
+        return tuple(_freeze(node) for node in ast)
+    return ast
+
+
+def _thaw(ast: Any) -> Any:
+    """
+    Converts a tuple-based AST back into the public list-based AST.
+    """
+    if isinstance(ast, tuple):
+        return [_thaw(node) for node in ast]
+    return ast
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(query: str) -> tuple:
+    """
+    Parses a query string, memoized by the query string. Returns a frozen AST
+    so that callers cannot mutate the cached value.
+    """
+    return _freeze(FuzzyQuery._parse(query))
+
+
+# Operators whose operands may be reordered without changing the result
+_COMMUTATIVE_OPS = frozenset({'and', 'or', 'sym-diff'})
+
+
+def _canonical(ast: Any) -> Any:
+    """
+    Returns the canonical form of a frozen AST, in which the operands of
+    commutative operators are sorted so that equivalent subtrees compare equal.
+    """
+    if isinstance(ast, tuple) and ast:
+        operands = tuple(_canonical(node) for node in ast[1:])
+        if ast[0] in _COMMUTATIVE_OPS:
+            operands = tuple(sorted(operands, key=repr))
+        return (ast[0],) + operands
+    return ast
+
+
+def _memoize(fn: Callable, slot: int) -> Callable:
+    """
+    Wraps a compiled closure so that it is evaluated at most once per document,
+    storing its result in `memo[slot]`.
+    """
+    def wrapper(doc, membership_fn, memo):
+        value = memo.get(slot)
+        if value is None:
+            value = fn(doc, membership_fn, memo)
+            memo[slot] = value
+        return value
+    return wrapper
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(cls: type, ast: Any) -> Callable[[Any, Callable, dict], float]:
+    """
+    Compiles a frozen AST into a closure `fn(doc, membership_fn, memo) -> float`
+    using the operator tables of `cls`, where `memo` is a fresh dict per
+    document. Memoized by `(cls, ast)`, so recurring queries are only compiled
+    once.
+
+    Common subexpressions are eliminated: the AST is canonicalized, identical
+    subtrees share a single closure, and subtrees that occur more than once
+    are evaluated at most once per document.
+
+    Raises:
+        ValueError: If the AST contains an unknown operator or a unary
+            operator with the wrong number of operands.
+        TypeError: If an AST node is neither a string nor a list.
+    """
+    ast = _canonical(ast)
+
+    # Count occurrences of each subtree, descending only into first occurrences
+    counts = {}
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        counts[node] = counts.get(node, 0) + 1
+        if counts[node] == 1 and isinstance(node, tuple):
+            stack.extend(node[1:])
+    shared = [node for node, count in counts.items() if count > 1]
+    slots = {node: slot for slot, node in enumerate(shared)}
+
+    seen = {}
+
+    def _build(node: Any) -> Callable:
+        fn = seen.get(node)
+        if fn is not None:
+            return fn
+        if isinstance(node, str):
+            fn = lambda doc, membership_fn, memo: membership_fn(node, doc)
+        elif isinstance(node, tuple):
+            op = node[0]
+            children = [_build(operand) for operand in node[1:]]
+            if op in cls.nary_ops:
+                nary = cls.nary_ops[op]
+                fn = lambda doc, membership_fn, memo: nary(
+                    [child(doc, membership_fn, memo) for child in children])
+            elif op in cls.unary_ops:
+                if len(children) != 1:
+                    raise ValueError(f"Operator '{op}' requires exactly one operand.")
+                unary = cls.unary_ops[op]
+                child = children[0]
+                fn = lambda doc, membership_fn, memo: unary(
+                    child(doc, membership_fn, memo))
+            else:
+                raise ValueError(f"Unknown operator: {op}")
+        else:
+            raise TypeError("Query parts must be strings or lists.")
+        if node in slots:
+            fn = _memoize(fn, slots[node])
+        seen[node] = fn
+        return fn
+
+    return _build(ast)
+
+
+# Queries whose DNF has more clauses than this are evaluated by tree walk
+_MAX_DNF_CLAUSES = 64
+
+# Unary operators that are monotone on [0, 1] and so commute with min/max
+_DNF_UNARY_OPS = frozenset({'very', 'somewhat', 'slightly', 'extremely', 'not'})
+
+# A DNF literal is a term plus the unary operators applied to it, innermost first
+_Literal = Tuple[str, Tuple[str, ...]]
+
+
+def _dnf_clauses(ast: Any, max_clauses: int = _MAX_DNF_CLAUSES
+                 ) -> Optional[Tuple[Tuple[_Literal, ...], ...]]:
+    """
+    Normalizes a frozen AST into disjunctive normal form.
+
+    `and`/`or` distribute over each other, and every unary operator in
+    `_DNF_UNARY_OPS` is monotone, so it can be pushed down to the terms
+    (with `not` swapping `and` and `or`, as in De Morgan's laws).
+
+    Returns:
+        A tuple of clauses, each a tuple of literals, or None if the AST uses
+        other operators, is malformed, or its DNF exceeds `max_clauses`.
+    """
+    def _dnf(node, chain):
+        if isinstance(node, str):
+            return [((node, chain),)]
+        if not isinstance(node, tuple) or not node:
+            return None
+        op, operands = node[0], node[1:]
+        if op in _DNF_UNARY_OPS:
+            if len(operands) != 1:
+                return None
+            return _dnf(operands[0], (op,) + chain)
+        if op not in ('and', 'or') or not operands:
+            return None
+        if chain.count('not') % 2:
+            op = 'or' if op == 'and' else 'and'
+        parts = []
+        for operand in operands:
+            clauses = _dnf(operand, chain)
+            if clauses is None:
+                return None
+            parts.append(clauses)
+        if op == 'or':
+            result = [clause for clauses in parts for clause in clauses]
+        else:
+            result = [()]
+            for clauses in parts:
+                if len(result) * len(clauses) > max_clauses:
+                    return None
+                result = [left + right for left in result for right in clauses]
+        if len(result) > max_clauses:
+            return None
+        return result
+
+    clauses = _dnf(ast, ())
+    if clauses is None:
+        return None
+    # min and max are idempotent, so repeated literals and clauses collapse
+    unique = {tuple(dict.fromkeys(clause)): None for clause in clauses}
+    return tuple(unique)
+
+
+def to_dnf(ast: List) -> List:
+    """
+    Normalizes a query AST into disjunctive normal form,
+    `['or', ['and', literal, ...], ...]`, where each literal is a term wrapped
+    in zero or more unary operators (e.g. `['very', ['not', 'cat']]`).
+
+    Args:
+        ast (list): A query AST using only `and`, `or`, `not`, `very`,
+            `somewhat`, `slightly` and `extremely`.
+
+    Returns:
+        list: An equivalent AST in disjunctive normal form.
+
+    Raises:
+        ValueError: If the AST cannot be normalized or its DNF has more than
+            `_MAX_DNF_CLAUSES` clauses.
+    """
+    clauses = _dnf_clauses(_freeze(ast))
+    if clauses is None:
+        raise ValueError("Query cannot be normalized to disjunctive normal form.")
+
+    def _literal(term, chain):
+        node = term
+        for op in chain:
+            node = [op, node]
+        return node
+
+    return ['or'] + [['and'] + [_literal(*lit) for lit in clause]
+                     for clause in clauses]
+
+
+_dnf_plan = functools.lru_cache(maxsize=1024)(_dnf_clauses)
+
+
+def _terms(ast: Any) -> List[str]:
+    """
+    Returns the distinct terms of a frozen AST in first-seen order.
+    """
+    terms = {}
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            terms[node] = None
+        elif isinstance(node, tuple):
+            stack.extend(reversed(node[1:]))
+    return list(terms)
+
+
+def _membership_matrix(terms: List[str],
+                       docs: List,
+                       membership_fn: Callable,
+                       membership_fn_batch: Optional[Callable],
+                       dtype: Any) -> np.ndarray:
+    """
+    Computes the `(num_docs, num_terms)` matrix of the degree of membership of
+    each term in each document, with a single call to `membership_fn_batch`
+    if one is given and otherwise one call to `membership_fn` per entry.
+    """
+    if membership_fn_batch is not None:
+        M = np.asarray(membership_fn_batch(terms, docs), dtype=dtype)
+        if M.shape != (len(terms), len(docs)):
+            raise ValueError(
+                f"membership_fn_batch returned shape {M.shape}, "
+                f"expected {(len(terms), len(docs))}.")
+        return M.T
+    return np.fromiter((membership_fn(term, doc) for doc in docs for term in terms),
+                       dtype=dtype, count=len(docs) * len(terms)
+                       ).reshape(len(docs), len(terms))
+
+
+def _eval_dnf(cls: type,
+              clauses: Tuple[Tuple[_Literal, ...], ...],
+              docs: List,
+              membership_fn: Callable,
+              dtype: Any = np.float64,
+              membership_fn_batch: Optional[Callable] = None) -> np.ndarray:
+    """
+    Evaluates a query in DNF over all documents as a max-min composition.
+
+    The membership of every distinct term in every document is computed once
+    into a `(num_docs, num_terms)` matrix, the unary operators of each literal
+    are applied column-wise, and then each clause is the row-wise min over its
+    literals and the query is the row-wise max over its clauses. On large
+    corpora the composition runs in a compiled, multi-threaded kernel when
+    Numba is available.
+    """
+    literals = list(dict.fromkeys(lit for clause in clauses for lit in clause))
+    terms = list(dict.fromkeys(term for term, _ in literals))
+    term_index = {term: i for i, term in enumerate(terms)}
+    literal_index = {lit: j for j, lit in enumerate(literals)}
+
+    M = _membership_matrix(terms, docs, membership_fn, membership_fn_batch, dtype)
+
+    L = np.empty((len(docs), len(literals)), dtype=dtype)
+    for j, (term, chain) in enumerate(literals):
+        column = M[:, term_index[term]]
+        for op in chain:
+            column = cls.unary_ops[op](column)
+        L[:, j] = column
+
+    columns = [[literal_index[lit] for lit in clause] for clause in clauses]
+    out = np.zeros(len(docs), dtype=dtype)
+
+    if _kernels.HAVE_NUMBA and len(docs) >= _kernels.MIN_DOCS:
+        indptr = np.cumsum([0] + [len(cols) for cols in columns], dtype=np.int64)
+        indices = np.fromiter((j for cols in columns for j in cols),
+                              dtype=np.int64, count=int(indptr[-1]))
+        _kernels.max_min_compose(L, indptr, indices, out)
+        return out
+
+    for cols in columns:
+        np.maximum(out, L[:, cols].min(axis=1), out=out)
+    return out
+
 
 class FuzzyQuery:
     """
@@ -119,8 +424,8 @@ class FuzzyQuery:
         'diff': lambda a, b: max(a - b, 0)
     }
 
-    # List of all operators
-    ops = list(unary_ops.keys()) + list(nary_ops.keys())
+    # Set of all operators
+    ops = frozenset(unary_ops) | frozenset(nary_ops)
 
     def __init__(self, query: Union[str, List]):
         """
@@ -147,6 +452,9 @@ class FuzzyQuery:
         Maps the input query string to the AST representation, a nested list
         structure representing the query. The AST is valid JSON.
 
+        Parsed ASTs are memoized by query string, so re-parsing a recurring
+        query only costs a copy of the cached AST.
+
         Args:
             query (str): The query string.
 
@@ -156,47 +464,60 @@ class FuzzyQuery:
         Raises:
             ValueError: If there are mismatched parentheses or unexpected tokens.
         """
-        def _build(ast: List) -> List:
-            if not ast:
-                raise ValueError("Unexpected end of query.")
+        return _thaw(_parse_cached(query))
 
-            if ast[0] == '(':
-                ast.pop(0)
-
-            if not ast:
+    @staticmethod
+    def _parse(query: str) -> List:
+        """
+        Uncached implementation of `parse`.
+        """
+        def _group(terms: List) -> List:
+            if not terms:
                 raise ValueError("Unexpected end of query after '('.")
-            
-            if ast[0].lower() in FuzzyQuery.ops:
-                op = ast.pop(0).lower()
+            head = terms[0]
+            if isinstance(head, str):
+                op = head.lower()
+                if op in FuzzyQuery.ops:
+                    terms[0] = op
+                    return terms
+            return ['and'] + terms
+
+        # A stack of partially built groups; the bottom one is the top level
+        stack = [[]]
+        for tok in re.findall(r'\b\w+\b|\(|\)', query):
+            if tok == '(':
+                stack.append([])
+            elif tok == ')':
+                if len(stack) == 1:
+                    raise ValueError("Unexpected ')' in query.")
+                group = stack.pop()
+                stack[-1].append(_group(group))
             else:
-                op = 'and'
-
-            result = [op]
-            while ast and ast[0] != ')':
-                if ast[0] == '(':
-                    ast.pop(0)  # Remove '('
-                    result.append(_build(ast))
-                else:
-                    result.append(ast.pop(0))
+                stack[-1].append(tok)
 
-            if ast and ast[0] == ')':
-                ast.pop(0)
+        if len(stack) != 1:
+            raise ValueError("Missing ')' in query.")
 
-            return result
-
-        tokens = re.findall(r'\b\w+\b|\(|\)', query)
-        return _build(tokens)
+        top = stack[0]
+        if not top:
+            raise ValueError("Unexpected end of query.")
+        if len(top) == 1 and isinstance(top[0], list):
+            return top[0]
+        return _group(top)
     
-    def __call__(self, docs, membership_fn=None) -> FuzzySet:
+    def __call__(self, docs, membership_fn=None, dtype=np.float64,
+                 membership_fn_batch=None) -> FuzzySet:
         """
         A shortcut for evaluating the fuzzy query against a list of documents.
         See: `FuzzyQuery.eval`.        
         """
-        return self.eval(docs, membership_fn)        
+        return self.eval(docs, membership_fn, dtype, membership_fn_batch)
 
     def eval(self,
              docs: List,
-             membership_fn: Callable = None) -> FuzzySet:
+             membership_fn: Callable = None,
+             dtype: Any = np.float64,
+             membership_fn_batch: Optional[Callable] = None) -> FuzzySet:
         """
         Evaluates the fuzzy query against a list of documents.
 
@@ -208,6 +529,19 @@ class FuzzyQuery:
                 term and a document, and return a float between 0 and 1.
                 Defaults to crisp set-membership function (classical), assigning
                 1.0 if the term is in the document, and 0.0 otherwise.
+            dtype (optional): The floating-point type of the membership matrix
+                when the query is evaluated as a max-min composition. Defaults
+                to `np.float64`, which gives the same degrees as the tree walk.
+                `np.float32` halves memory traffic, but `not` and the hedges
+                then work on degrees rounded to about 1e-7, and strong hedges
+                such as `slightly` magnify that error well past 1e-6.
+            membership_fn_batch (Callable, optional): A vectorized alternative
+                to `membership_fn`. It should accept a list of terms and the
+                list of documents, and return an array of shape
+                `(num_terms, num_docs)` of degrees of membership. It is called
+                once per evaluation, which suits membership functions backed by
+                array or embedding models. A `membership_fn` with the attribute
+                `vectorized = True` is used as `membership_fn_batch`.
 
         Returns:
             FuzzySet: A FuzzySet containing the degrees of membership for each
@@ -215,34 +549,44 @@ class FuzzyQuery:
 
         Raises:
             ValueError: If there is an error during evaluation.
+            TypeError: If the AST contains parts that are not strings or lists.
         """
         if membership_fn is None:
             membership_fn = lambda term, doc: 1.0 if term in doc else 0.0
+        if membership_fn_batch is None and getattr(membership_fn, 'vectorized', False) is True:
+            membership_fn_batch = membership_fn
+
+        ast = _freeze(self.ast)
 
-        def _eval(query_part: Union[str, list], doc) -> float:
-            if isinstance(query_part, str):
-                return membership_fn(query_part, doc)
-            elif isinstance(query_part, list):
-                op = query_part[0]
-                if op in self.nary_ops.keys():
-                    operands = [_eval(operand, doc) for operand in query_part[1:]]
-                    return self.nary_ops[op](operands)
-                elif op in self.unary_ops.keys():
-                    if len(query_part) != 2:
-                        raise ValueError(f"Operator '{op}' requires exactly one operand.")
-                    operand = _eval(query_part[1], doc)
-                    return self.unary_ops[op](operand)
-                else:
-                    raise ValueError(f"Unknown operator: {op}")
-            else:
-                raise TypeError("Query parts must be strings or lists.")
-            
         if not isinstance(docs, list):
             docs = [docs]
 
-        degrees_of_membership = [_eval(self.ast, doc) for doc in docs]
+        # Queries over and/or/not and the hedges are evaluated over all
+        # documents at once as a max-min composition; others by tree walk
+        clauses = _dnf_plan(ast) if self._has_default_ops() else None
+        if clauses is not None:
+            return FuzzySet(_eval_dnf(type(self), clauses, docs, membership_fn,
+                                      dtype, membership_fn_batch))
+
+        fn = _compile(type(self), ast)
+        if membership_fn_batch is not None:
+            # Walk the tree over rows of the precomputed membership matrix
+            terms = _terms(ast)
+            column = {term: j for j, term in enumerate(terms)}
+            docs = _membership_matrix(terms, docs, None, membership_fn_batch,
+                                      dtype).tolist()
+            membership_fn = lambda term, row: row[column[term]]
+        degrees_of_membership = [fn(doc, membership_fn, {}) for doc in docs]
         return FuzzySet(degrees_of_membership)
 
+    def _has_default_ops(self) -> bool:
+        """
+        Whether this query uses FuzzyQuery's own operator tables, whose
+        semantics the DNF evaluation relies on.
+        """
+        return (self.unary_ops is FuzzyQuery.unary_ops
+                and self.nary_ops is FuzzyQuery.nary_ops)
+
     def __and__(self, other: 'FuzzyQuery') -> 'FuzzyQuery':
         """
         Combines two FuzzyQueries with a logical AND.
@@ -346,23 +690,34 @@ class FuzzyQuery:
         Returns:
             str: The string representation of the FuzzyQuery.
         """
-        def _build(ast: Union[str, list]) -> str:
-            if isinstance(ast, str):
-                return ast
-            elif isinstance(ast, list):
-                op = ast[0]
-                operands = ast[1:]
-                if op in self.unary_ops.keys():
-                    return f"({op} {_build(operands[0])})"
-                elif op in self.nary_ops.keys():
-                    operand_strs = ' '.join(_build(operand) for operand in operands)
-                    return f"({op} {operand_strs})"
+        # Iterative preorder walk; `_close` marks where a group's ')' goes
+        _close = object()
+        parts = []
+        stack = [(self.ast, '')]
+        while stack:
+            node, sep = stack.pop()
+            if node is _close:
+                parts.append(')')
+            elif isinstance(node, str):
+                parts.append(sep)
+                parts.append(node)
+            elif isinstance(node, list):
+                op = node[0]
+                if op in self.unary_ops:
+                    operands = node[1:2]
+                elif op in self.nary_ops:
+                    operands = node[1:]
                 else:
                     raise ValueError(f"Unknown operator: {op}")
+                parts.append(sep)
+                parts.append('(')
+                parts.append(op)
+                stack.append((_close, ''))
+                stack.extend((operand, ' ') for operand in reversed(operands))
             else:
                 raise TypeError("AST elements must be strings or lists.")
-            
-        return _build(self.ast)
+
+        return ''.join(parts)
 
     def __repr__(self) -> str:
         """
@@ -1,9 +1,15 @@
-from typing import List, Union, Iterator
+import numpy as np
+from typing import Iterable, List, Union, Iterator
+from . import _kernels
 
 """
 A module for working with fuzzy sets and fuzzy logic in Python.
 """
 
+# Sets up to this size are validated element by element: for a handful of
+# values the interpreter is faster than NumPy's per-call overhead
+_SMALL = 8
+
 class FuzzySet:
     """
     Represents a fuzzy set of elements (e.g., documents), where each element has an associated
@@ -21,6 +27,10 @@ class FuzzySet:
     - Fuzzy Union (`|`): Element-wise maximum of degrees of membership.
     - Fuzzy Complement (`~`): Element-wise complement (`1.0 - membership`).
 
+    The degrees of membership are stored as a contiguous `numpy.ndarray` of
+    float64 in `memberships`, so these operations each run as a single
+    vectorized loop.
+
     ## Additional Operations
 
     This class implements a bare-bones version of fuzzy set operations. For more
@@ -31,20 +41,48 @@ class FuzzySet:
     - Fuzzy Set Sampling in `fuzzy_sampling.py`        
     """
 
-    def __init__(self, memberships: List[float]):
+    def __init__(self, memberships: Union[Iterable[float], np.ndarray]):
         """
         Initializes a FuzzySet with the given degrees of membership.
 
         Args:
-            memberships (List[float]): A list of degrees of membership between 0 and 1.
+            memberships (Iterable[float] or np.ndarray): A sequence, or any
+                iterable, of degrees of membership between 0 and 1.
 
         Raises:
             ValueError: If any membership value is not between 0 and 1.
         """
-        if not all(0.0 <= m <= 1.0 for m in memberships):
+        if isinstance(memberships, np.ndarray):
+            memberships = np.ascontiguousarray(memberships, dtype=np.float64)
+        elif not hasattr(memberships, '__len__'):
+            # Fill the array straight from an iterator or generator
+            memberships = np.fromiter(memberships, dtype=np.float64)
+        elif len(memberships) <= _SMALL:
+            memberships = np.array(memberships, dtype=np.float64)
+        else:
+            memberships = np.fromiter(memberships, dtype=np.float64,
+                                      count=len(memberships))
+        # Both checks also reject NaN, unlike min()/max()
+        if memberships.size <= _SMALL:
+            valid = all(0.0 <= m <= 1.0 for m in memberships.tolist())
+        else:
+            # One pass over the buffer
+            valid = np.all((memberships >= 0.0) & (memberships <= 1.0))
+        if not valid:
             raise ValueError("All memberships must be between 0 and 1.")
         self.memberships = memberships
 
+    @classmethod
+    def _from_trusted(cls, memberships: np.ndarray) -> 'FuzzySet':
+        """
+        Wraps a contiguous float64 array known to lie in [0, 1], such as the
+        result of an operation on valid FuzzySets, without copying or
+        validating it.
+        """
+        fuzzy_set = cls.__new__(cls)
+        fuzzy_set.memberships = memberships
+        return fuzzy_set
+
     def __and__(self, other: 'FuzzySet') -> 'FuzzySet':
         """
         Returns the fuzzy intersection (AND) of two FuzzySets.
@@ -60,7 +98,9 @@ class FuzzySet:
         """
         if len(self.memberships) != len(other.memberships):
             raise ValueError("FuzzySets must be of the same length.")
-        return FuzzySet([min(a, b) for a, b in zip(self.memberships, other.memberships)])
+        out = np.empty_like(self.memberships)
+        _kernels.minimum(self.memberships, other.memberships, out)
+        return FuzzySet._from_trusted(out)
 
     def __or__(self, other: 'FuzzySet') -> 'FuzzySet':
         """
@@ -77,7 +117,9 @@ class FuzzySet:
         """
         if len(self.memberships) != len(other.memberships):
             raise ValueError("FuzzySets must be of the same length.")
-        return FuzzySet([max(a, b) for a, b in zip(self.memberships, other.memberships)])
+        out = np.empty_like(self.memberships)
+        _kernels.maximum(self.memberships, other.memberships, out)
+        return FuzzySet._from_trusted(out)
 
     def __invert__(self) -> 'FuzzySet':
         """
@@ -86,7 +128,48 @@ class FuzzySet:
         Returns:
             FuzzySet: A new FuzzySet representing the complement.
         """
-        return FuzzySet([1 - m for m in self.memberships])
+        out = np.empty_like(self.memberships)
+        _kernels.complement(self.memberships, out)
+        return FuzzySet._from_trusted(out)
+
+    def product_and(self, other: 'FuzzySet') -> 'FuzzySet':
+        """
+        Returns the fuzzy intersection of two FuzzySets under the product
+        t-norm (`a * b`).
+
+        Args:
+            other (FuzzySet): Another FuzzySet to intersect with.
+
+        Returns:
+            FuzzySet: A new FuzzySet representing the intersection.
+
+        Raises:
+            ValueError: If the FuzzySets are not of the same length.
+        """
+        if len(self.memberships) != len(other.memberships):
+            raise ValueError("FuzzySets must be of the same length.")
+        return FuzzySet._from_trusted(self.memberships * other.memberships)
+
+    def product_or(self, other: 'FuzzySet') -> 'FuzzySet':
+        """
+        Returns the fuzzy union of two FuzzySets under the probabilistic sum
+        (`a + b - a * b`), the t-conorm dual to the product t-norm.
+
+        Args:
+            other (FuzzySet): Another FuzzySet to union with.
+
+        Returns:
+            FuzzySet: A new FuzzySet representing the union.
+
+        Raises:
+            ValueError: If the FuzzySets are not of the same length.
+        """
+        if len(self.memberships) != len(other.memberships):
+            raise ValueError("FuzzySets must be of the same length.")
+        # Computed as 1 - (1 - a)(1 - b), which cannot round above 1
+        out = (1.0 - self.memberships) * (1.0 - other.memberships)
+        np.subtract(1.0, out, out=out)
+        return FuzzySet._from_trusted(out)
 
     # Comparison Operators
     def __eq__(self, other: 'FuzzySet') -> bool:
@@ -99,10 +182,14 @@ class FuzzySet:
         Returns:
             bool: True if the memberships are equal, False otherwise.
         """
-        # check for approximate equality
-        if len(self.memberships) != len(other.memberships):
+        if not isinstance(other, FuzzySet):
+            return NotImplemented
+        # check for approximate equality, to the baseline tolerance of 1e-6;
+        # evaluation paths agree to rounding and do not rely on it
+        a, b = self.memberships, other.memberships
+        if a.shape != b.shape:
             return False
-        return all(abs(a - b) < 1e-6 for a, b in zip(self.memberships, other.memberships))
+        return bool(np.allclose(a, b, rtol=0.0, atol=1e-6))
 
     def __ne__(self, other: 'FuzzySet') -> bool:
         """
@@ -114,7 +201,7 @@ class FuzzySet:
         Returns:
             bool: True if the memberships are not equal, False otherwise.
         """
-        return not (self.memberships == other.memberships)
+        return not self == other
 
     # Sequence Protocol Methods
     def __getitem__(self, index: int) -> float:
@@ -172,7 +259,11 @@ class FuzzySet:
         Returns:
             bool: True if the value is in the memberships, False otherwise.
         """
-        return item in self.memberships
+        memberships = self.memberships
+        if memberships.size <= _SMALL:
+            return item in memberships.tolist()
+        # One vectorized comparison over the whole buffer
+        return bool((memberships == item).any())
     
     def __xor__(self, other: 'FuzzySet') -> 'FuzzySet':
         """
@@ -190,7 +281,9 @@ class FuzzySet:
         """
         if len(self.memberships) != len(other.memberships):
             raise ValueError("FuzzySets must be of the same length.")
-        return (self & ~other) | (~self & other)
+        out = np.empty_like(self.memberships)
+        _kernels.xor(self.memberships, other.memberships, out)
+        return FuzzySet._from_trusted(out)
     
     def __sub__(self, other: 'FuzzySet') -> 'FuzzySet':
         """
@@ -207,7 +300,9 @@ class FuzzySet:
         """
         if len(self.memberships) != len(other.memberships):
             raise ValueError("FuzzySets must be of the same length.")
-        return self & ~other
+        out = np.empty_like(self.memberships)
+        _kernels.sub(self.memberships, other.memberships, out)
+        return FuzzySet._from_trusted(out)
        
     # Representation Methods
     def __repr__(self) -> str:
@@ -217,7 +312,7 @@ class FuzzySet:
         Returns:
             str: The string representation.
         """
-        return f"FuzzySet({self.memberships})"
+        return f"FuzzySet({self.memberships.tolist()})"
 
     def __str__(self) -> str:
         """
@@ -226,6 +321,7 @@ class FuzzySet:
         Returns:
             str: A truncated string representation.
         """
-        if len(self.memberships) > 6:
-            return f"FuzzySet({self.memberships[:6]}...)"
-        return f"FuzzySet({self.memberships})"
+        # Only the shown head is converted to Python floats
+        head = self.memberships[:6].tolist()
+        suffix = "..." if len(self.memberships) > 6 else ""
+        return f"FuzzySet({head}{suffix})"
@@ -151,7 +151,7 @@ def fuzzy_lift(
         ValueError: If the FuzzySet is empty.
     """
 
-    if not fuzzy_set.memberships:
+    if not len(fuzzy_set.memberships):
         raise ValueError("Cannot lift an empty FuzzySet.")
     
     cartesian_memberships = fuzzy_cartesian_product(fuzzy_set, fuzzy_set, t_norm)
@@ -1,3 +1,4 @@
+import numpy as np
 from .fuzzy_set import FuzzySet
 
 """
@@ -11,7 +12,12 @@ def power(fuzzy_set: FuzzySet, n: int) -> FuzzySet:
     Returns:
         FuzzySet: A new FuzzySet with modified degrees of membership.
     """
-    return FuzzySet([m ** n for m in fuzzy_set.memberships])
+    memberships = fuzzy_set.memberships
+    if n == 2:
+        return FuzzySet(np.square(memberships))
+    if n == 0.5:
+        return FuzzySet(np.sqrt(memberships))
+    return FuzzySet(np.power(memberships, n))
 
 def very(fuzzy_set: FuzzySet) -> FuzzySet:
     """
@@ -57,7 +63,7 @@ def true(fuzzy_set: FuzzySet) -> FuzzySet:
     Returns:
         FuzzySet: A new FuzzySet where all memberships are 1.
     """
-    return FuzzySet([1.0 for _ in fuzzy_set.memberships])
+    return FuzzySet(np.ones(len(fuzzy_set.memberships)))
 
 def false(fuzzy_set: FuzzySet) -> 'FuzzySet':
     """
@@ -66,7 +72,7 @@ def false(fuzzy_set: FuzzySet) -> 'FuzzySet':
     Returns:
         FuzzySet: A new FuzzySet where all memberships are 0.
     """
-    return FuzzySet([0.0 for _ in fuzzy_set.memberships])
+    return FuzzySet(np.zeros(len(fuzzy_set.memberships)))
 
 def truth(fuzzy_set: FuzzySet, threshold: float = 0.5) -> FuzzySet:
     """
@@ -78,7 +84,7 @@ def truth(fuzzy_set: FuzzySet, threshold: float = 0.5) -> FuzzySet:
     Returns:
         FuzzySet: A new FuzzySet with mapped degrees of membership.
     """
-    return FuzzySet([0.0 if m < threshold else 1.0 for m in fuzzy_set.memberships])
+    return FuzzySet(np.where(fuzzy_set.memberships < threshold, 0.0, 1.0))
 
 def threshold(self, threshold: float) -> 'FuzzySet':
     """
@@ -90,7 +96,5 @@ def threshold(self, threshold: float) -> 'FuzzySet':
     Returns:
         FuzzySet: A new FuzzySet with thresholded memberships.
     """
-    filtered_memberships = [
-        m if m >= threshold else 0.0 for m in self.memberships
-    ]
-    return FuzzySet(filtered_memberships)
+    memberships = self.memberships
+    return FuzzySet(np.where(memberships >= threshold, memberships, 0.0))
@@ -102,7 +102,7 @@ def sample(fuzzy_set: FuzzySet, n: int, replacement=False) -> List[int]:
         if n > len(fuzzy_set.memberships):
             raise ValueError("Sample size n cannot be larger than the number of elements when sampling without replacement.")
         sampled_indices = weighted_sample_without_replacement(
-            fuzzy_set.memberships, n)
+            fuzzy_set.memberships.tolist(), n)
     return sampled_indices
     
 def weighted_sample_without_replacement(weights: List[float], n: int) -> List[int]:
@@ -22,15 +22,188 @@ Example:
     >>> list(result)  # Returns (doc, membership) tuples
 """
 
-from typing import Any, Dict, List, Optional, Generator, Tuple, Union, Callable
+from typing import Any, Dict, Iterable, List, Optional, Generator, Tuple, Union, Callable
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import heapq
 import json
 import logging
+import math
+import mmap
+import os
 from pathlib import Path
+import numpy as np
+from . import _kernels
+from .membership_functions import quantize_membership
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+# T-norms (fuzzy AND) and their dual t-conorms (fuzzy OR)
+TNORMS: Dict[str, Tuple[Callable[[float, float], float],
+                        Callable[[float, float], float]]] = {
+    "min": (min, max),
+    "product": (lambda a, b: a * b,
+                lambda a, b: 1.0 - (1.0 - a) * (1.0 - b)),
+}
+
+
+# Membership degree 1.0 in each supported dtype
+_FULL = {np.dtype(np.float64): 1.0, np.dtype(np.uint8): 255}
+
+
+def _hedge(p: float) -> Callable[[Any], Any]:
+    """
+    Modifier raising a membership degree, or an array of them, to the power
+    p. Squares and square roots use the dedicated multiply and sqrt rather
+    than a general power.
+    """
+    if p == 2:
+        return lambda x: x * x
+    if p == 0.5:
+        return lambda x: np.sqrt(x) if isinstance(x, np.ndarray) else math.sqrt(x)
+    return lambda x: np.power(x, p) if isinstance(x, np.ndarray) else x ** p
+
+
+def _evaluate_branches(left: "FuzzyLazyStream", right: "FuzzyLazyStream"
+                       ) -> Tuple[Iterable[Tuple[Any, float]],
+                                  Iterable[Tuple[Any, float]]]:
+    """
+    Evaluate the two operands of a binary stream operation.
+
+    Operands over large in-memory sources are batch-evaluated in two
+    threads, since NumPy releases the GIL in their vectorized work; any
+    other operand is streamed.
+
+    Returns:
+        The (document, membership) pairs of `left` and of `right`
+    """
+    left_columns, right_columns = left._root_columns(), right._root_columns()
+    if left_columns is None or right_columns is None:
+        return left.evaluate(), right.evaluate()
+    
+    # Both branches see the documents as they are now. Branches over the
+    # same source share its store, which is refreshed and counted once.
+    stores = {id(store): store for store in (left_columns, right_columns)}.values()
+    for store in stores:
+        store.refresh()
+    branches = (left, right)
+    if sum(map(len, stores)) >= _kernels.MIN_DOCS:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(branch._batch_evaluate) for branch in branches]
+            batches = [future.result() for future in futures]
+    else:
+        batches = [branch._batch_evaluate() for branch in branches]
+    return tuple(branch.evaluate() if batch is None else branch._materialize(batch)
+                 for branch, batch in zip(branches, batches))
+
+
+class ColumnStore:
+    """
+    Columnar view of an in-memory list of documents.
+
+    A numeric field that every document has is gathered into one float64
+    array on first use, so that filters on it run as vectorized comparisons
+    instead of a dict lookup per document. Documents themselves are not
+    copied; position `i` of every column belongs to `docs[i]`. Columns are a
+    snapshot of the documents: streams call `refresh` at the start of each
+    evaluation, so documents appended or edited between evaluations are
+    seen, while one evaluation reads each column once.
+
+    The store also memoizes the membership degrees of filter queries, so
+    branches of one evaluation that repeat a filter over the same source
+    evaluate it once per document. Like the columns, the memoized degrees
+    are dropped by `refresh`.
+    """
+
+    def __init__(self, docs: List[Any]):
+        """
+        Create a column store.
+
+        Args:
+            docs: List of documents
+        """
+        self.docs = docs
+        self._columns: Dict[str, Optional[np.ndarray]] = {}
+        self._degrees: Dict[Any, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def refresh(self) -> None:
+        """
+        Drop the columns built and degrees memoized so far, so that they are
+        recomputed from the documents as they are now.
+        """
+        # Rebound rather than cleared, so an evaluation still holding the
+        # previous arrays is unaffected
+        self._columns = {}
+        self._degrees = {}
+
+    def column(self, field_path: str) -> Optional[np.ndarray]:
+        """
+        Get the values of a field as a float64 array.
+
+        Args:
+            field_path: Dotted field path without wildcards, e.g. "user.age"
+
+        Returns:
+            Array with one value per document, or None if some document
+            lacks the field or has a non-numeric value there
+        """
+        if field_path not in self._columns:
+            self._columns[field_path] = self._build_column(field_path)
+        return self._columns[field_path]
+
+    def degrees(self, query: List) -> Optional[np.ndarray]:
+        """
+        Get the memoized membership degrees of a query.
+
+        Args:
+            query: Fuzzy query expression; equal queries share an array
+
+        Returns:
+            Float64 array with one degree per document, NaN where none has
+            been computed yet, for the caller to fill in; or None if the
+            query is not hashable
+        """
+        from .fuzzy_query import _freeze
+        
+        key = _freeze(query)
+        try:
+            cached = self._degrees.get(key)
+        except TypeError:
+            return None
+        if cached is None:
+            # setdefault, so that concurrent branches share one array
+            cached = self._degrees.setdefault(key, np.full(len(self.docs), np.nan))
+        return cached
+
+    def _build_column(self, field_path: str) -> Optional[np.ndarray]:
+        from .utils import _compile_path
+        
+        keys, has_wildcard = _compile_path(field_path)
+        if has_wildcard:
+            return None
+        values = []
+        for doc in self.docs:
+            value = doc
+            for key in keys:
+                if type(value) is not dict or key not in value:
+                    return None
+                value = value[key]
+            if type(value) is not int and type(value) is not float:
+                return None
+            values.append(value)
+        return np.array(values, dtype=np.float64)
+
+
 class FuzzyLazyStream(ABC):
     """
     Base class for all lazy fuzzy data streams.
@@ -44,16 +217,24 @@ class FuzzyLazyStream(ABC):
     """
     
     def __init__(self, source: Union[str, Path, List, Dict[str, Any]], 
-                 collection_id: Optional[str] = None):
+                 collection_id: Optional[str] = None,
+                 dtype: Any = np.float64):
         """
         Initialize a fuzzy lazy stream.
         
         Args:
             source: Data source (file path, list of docs, or source dict)
             collection_id: Optional identifier for this collection
+            dtype: float64, or uint8 to evaluate in-memory sources with
+                membership degrees quantized to multiples of 1/255
         """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float64, np.uint8):
+            raise ValueError(f"Unsupported membership dtype: {dtype}")
         self.source = self._normalize_source(source)
         self.collection_id = collection_id
+        self.dtype = dtype
+        self._column_store = None
         
     def _normalize_source(self, source: Any) -> Dict[str, Any]:
         """Normalize source to a consistent dict format."""
@@ -92,16 +273,105 @@ class FuzzyLazyStream(ABC):
         else:
             raise ValueError(f"Unknown source type: {source_type}")
     
+    def columns(self) -> Optional[ColumnStore]:
+        """
+        Get a columnar view of this stream's documents.
+
+        Returns:
+            ColumnStore over the documents of an in-memory source stream,
+            or None for other streams
+        """
+        if type(self) is not FuzzyLazyStream or self.source.get("type") != "memory":
+            return None
+        if self._column_store is None:
+            self._column_store = ColumnStore(self.source["data"])
+        return self._column_store
+
+    def _root_columns(self) -> Optional[ColumnStore]:
+        """Column store of the in-memory source this stream derives from."""
+        return self.columns()
+    
+    def _fresh_batch_evaluate(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Start an evaluation of the whole stream at once, over the documents
+        of its in-memory source as they are now (see `_batch_evaluate`).
+        """
+        store = self._root_columns()
+        if store is None:
+            return None
+        store.refresh()
+        return self._batch_evaluate()
+    
+    def _batch_evaluate(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Evaluate the whole stream at once over an in-memory source.
+        
+        Returns:
+            Tuple of (rows, memberships) arrays, where `rows` index the
+            documents of `_root_columns()`, in the order `evaluate` yields
+            them; or None if this stream cannot be evaluated in batch
+        """
+        store = self.columns()
+        if store is None:
+            return None
+        return np.arange(len(store)), np.full(len(store), _FULL[self.dtype],
+                                              dtype=self.dtype)
+    
+    def _step(self) -> Optional[Callable[[Any, float], Optional[float]]]:
+        """
+        This stream's per-document stage, as a function of a document and
+        its upstream membership returning the new membership, or None to
+        drop the document; None if the stream is not such a stage.
+        """
+        return None
+    
+    def _fused_scan(self) -> Generator[Tuple[Any, float], None, None]:
+        """
+        Evaluate this stream by streaming, applying the chain of
+        per-document stages that ends here in a single loop.
+        """
+        steps = []
+        stream = self
+        while True:
+            step = stream._step()
+            if step is None:
+                break
+            steps.append(step)
+            stream = stream.source
+        steps.reverse()
+        
+        for doc, membership in stream.evaluate():
+            for step in steps:
+                membership = step(doc, membership)
+                if membership is None:
+                    break
+            else:
+                yield (doc, membership)
+    
+    def _materialize(self, batch: Tuple[np.ndarray, np.ndarray]
+                     ) -> Generator[Tuple[Any, float], None, None]:
+        """Yield (document, membership) pairs of a batch evaluation."""
+        docs = self._root_columns().docs
+        rows, memberships = batch
+        if self.dtype == np.uint8:
+            memberships = memberships / 255.0
+        for i, membership in zip(rows.tolist(), memberships.tolist()):
+            yield (docs[i], membership)
+    
     def _stream_file(self, path: str) -> Generator[Any, None, None]:
         """Stream JSON documents from a file."""
         path = Path(path)
         
         if path.suffix == ".jsonl":
-            # Stream JSONL file line by line
-            with open(path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        yield json.loads(line)
+            # Stream JSONL file line by line from a read-only mapping,
+            # decoding each line's bytes directly (with orjson if installed)
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line in iter(mm.readline, b''):
+                        if line.strip():
+                            yield _json_loads(line)
         elif path.suffix == ".json":
             # Load entire JSON file (could be array or single doc)
             with open(path, 'r') as f:
@@ -169,19 +439,33 @@ class FuzzyLazyStream(ABC):
     
     def very(self) -> "FuzzyModifiedStream":
         """Apply 'very' modifier (square membership)."""
-        return FuzzyModifiedStream(lambda x: x ** 2, "very", self)
+        return FuzzyModifiedStream(_hedge(2), "very", self)
     
     def somewhat(self) -> "FuzzyModifiedStream":
         """Apply 'somewhat' modifier (square root membership)."""
-        return FuzzyModifiedStream(lambda x: x ** 0.5, "somewhat", self)
+        return FuzzyModifiedStream(_hedge(0.5), "somewhat", self)
     
     def slightly(self) -> "FuzzyModifiedStream":
         """Apply 'slightly' modifier (10th root membership)."""
-        return FuzzyModifiedStream(lambda x: x ** 0.1, "slightly", self)
+        return FuzzyModifiedStream(_hedge(0.1), "slightly", self)
     
     def extremely(self) -> "FuzzyModifiedStream":
         """Apply 'extremely' modifier (cube membership)."""
-        return FuzzyModifiedStream(lambda x: x ** 3, "extremely", self)
+        return FuzzyModifiedStream(_hedge(3), "extremely", self)
+    
+    def hedge(self, p: float) -> "FuzzyModifiedStream":
+        """
+        Apply a power hedge, raising membership to the power p.
+        
+        Args:
+            p: Positive exponent; p > 1 concentrates and p < 1 dilates
+            
+        Returns:
+            New stream with modified membership degrees
+        """
+        if not p > 0:
+            raise ValueError("Hedge exponent must be positive.")
+        return FuzzyModifiedStream(_hedge(p), f"hedge({p})", self)
     
     def not_fuzzy(self) -> "FuzzyModifiedStream":
         """Apply fuzzy NOT (complement membership)."""
@@ -189,29 +473,35 @@ class FuzzyLazyStream(ABC):
     
     # Fuzzy set operations
     
-    def fuzzy_and(self, other: "FuzzyLazyStream") -> "FuzzyIntersectionStream":
+    def fuzzy_and(self, other: "FuzzyLazyStream",
+                  tnorm: str = "min") -> "FuzzyIntersectionStream":
         """
         Fuzzy intersection with another stream (minimum membership).
         
         Args:
             other: Another fuzzy stream to intersect with
+            tnorm: "min" for the minimum, or "product" for the product
+                of membership degrees
             
         Returns:
-            New stream with minimum membership degrees
+            New stream with combined membership degrees
         """
-        return FuzzyIntersectionStream(self, other)
+        return FuzzyIntersectionStream(self, other, tnorm)
     
-    def fuzzy_or(self, other: "FuzzyLazyStream") -> "FuzzyUnionStream":
+    def fuzzy_or(self, other: "FuzzyLazyStream",
+                 tnorm: str = "min") -> "FuzzyUnionStream":
         """
         Fuzzy union with another stream (maximum membership).
         
         Args:
             other: Another fuzzy stream to union with
+            tnorm: "min" for the maximum, or "product" for the
+                probabilistic sum `a + b - a*b` of membership degrees
             
         Returns:
-            New stream with maximum membership degrees
+            New stream with combined membership degrees
         """
-        return FuzzyUnionStream(self, other)
+        return FuzzyUnionStream(self, other, tnorm)
     
     # Utility methods
     
@@ -310,25 +600,102 @@ class FuzzyFilteredStream(FuzzyLazyStream):
             "query": query,
             "inner_source": source.source
         }
-        super().__init__(filter_source, source.collection_id)
+        super().__init__(filter_source, source.collection_id, source.dtype)
         self.query = query
         self.source = source
+        self._query_fn = None
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Evaluate fuzzy filter, yielding docs with membership degrees."""
-        from .fuzzy_eval import fuzzy_eval
+        batch = self._fresh_batch_evaluate()
+        if batch is not None:
+            yield from self._materialize(batch)
+            return
         
-        for doc, existing_membership in self.source.evaluate():
-            # Evaluate fuzzy query to get new membership
-            query_membership = fuzzy_eval(self.query, doc)
-            
+        yield from self._fused_scan()
+    
+    def _step(self) -> Callable[[Any, float], Optional[float]]:
+        query_fn = self._compiled_query()
+        
+        def step(doc, existing_membership):
             # Combine with existing membership (minimum for AND semantics)
-            combined_membership = min(existing_membership, query_membership)
-            
-            # Only yield if membership > 0
-            if combined_membership > 0:
-                yield (doc, combined_membership)
+            combined_membership = min(existing_membership, query_fn(doc))
+            # Only keep if membership > 0
+            return combined_membership if combined_membership > 0 else None
+        return step
+    
+    def _compiled_query(self) -> Callable[[Any], float]:
+        """The query compiled into a function of a document."""
+        from .fuzzy_eval import compile_fuzzy_query
+        
+        if self._query_fn is None:
+            self._query_fn = compile_fuzzy_query(self.query)
+        return self._query_fn
     
+    def _root_columns(self) -> Optional[ColumnStore]:
+        return self.source._root_columns()
+    
+    def _batch_evaluate(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        batch = self.source._batch_evaluate()
+        if batch is None:
+            return None
+        rows, memberships = batch
+        
+        degrees = self._row_degrees(rows)
+        if self.dtype == np.uint8:
+            degrees = quantize_membership(degrees)
+        
+        # Combine with existing membership (minimum for AND semantics)
+        memberships = np.minimum(memberships, degrees)
+        keep = memberships > 0
+        return rows[keep], memberships[keep]
+    
+    def _row_degrees(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Membership degrees of the query for the given documents of an
+        in-memory source, reusing those already computed for an equal query.
+        """
+        cached = self._root_columns().degrees(self.query)
+        if cached is None:
+            cached = np.full(len(self._root_columns()), np.nan)
+        missing = rows[np.isnan(cached[rows])]
+        if len(missing):
+            column = self._column_degrees()
+            if column is not None:
+                cached[:] = column
+            else:
+                query_fn = self._compiled_query()
+                docs = self._root_columns().docs
+                cached[missing] = np.fromiter(
+                    (query_fn(docs[i]) for i in missing.tolist()),
+                    dtype=np.float64, count=len(missing))
+        return cached[rows]
+    
+    def _column_degrees(self) -> Optional[np.ndarray]:
+        """
+        Membership degrees of a `[op, "@field", number]` comparison for every
+        document of an in-memory source, computed over the field's column
+        at once.
+
+        Returns:
+            Array of degrees, or None if the query or source does not allow it
+        """
+        from .fuzzy_eval import COMPARISON_OPS, fuzzy_compare_array
+        
+        query = self.query
+        if not (isinstance(query, list) and len(query) == 3
+                and query[0] in COMPARISON_OPS
+                and isinstance(query[1], str) and query[1][:1] in ("@", ":")
+                and type(query[2]) in (int, float)):
+            return None
+        store = self._root_columns()
+        if store is None:
+            return None
+        column = store.column(query[1][1:])
+        if column is None:
+            return None
+        return fuzzy_compare_array(query[0], column, query[2])
+
     def _describe_pipeline(self) -> str:
         return f"fuzzy_filter({self.query}) → {self.source._describe_pipeline()}"
 
@@ -351,28 +718,31 @@ class FuzzyMappedStream(FuzzyLazyStream):
             "expression": expression,
             "inner_source": source.source
         }
-        super().__init__(map_source, source.collection_id)
+        super().__init__(map_source, source.collection_id, source.dtype)
         self.expression = expression
         self.source = source
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Transform values while preserving membership degrees."""
         from .utils import get_values_by_field_path
+        from .fuzzy_eval import compile_fuzzy_query
         
+        if isinstance(self.expression, str):
+            field_path = self.expression[1:]
+        else:
+            expression_fn = compile_fuzzy_query(self.expression)
         for doc, membership in self.source.evaluate():
             if isinstance(self.expression, str):
                 # Simple field extraction
                 if self.expression.startswith("@"):
                     # Field path like "@name" or "@user.email"
-                    field_path = self.expression[1:]
                     values = get_values_by_field_path(doc, field_path)
                     transformed = values[0] if values else None
                 else:
                     transformed = self.expression
             else:
                 # Complex expression evaluation
-                from .fuzzy_eval import fuzzy_eval
-                transformed = fuzzy_eval(self.expression, doc)
+                transformed = expression_fn(doc)
             
             yield (transformed, membership)
     
@@ -400,18 +770,51 @@ class FuzzyModifiedStream(FuzzyLazyStream):
             "modifier_name": name,
             "inner_source": source.source
         }
-        super().__init__(mod_source, source.collection_id)
+        super().__init__(mod_source, source.collection_id, source.dtype)
         self.modifier = modifier
         self.modifier_name = name
         self.source = source
+        self._table = None
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Apply modifier to membership degrees."""
-        for doc, membership in self.source.evaluate():
-            modified_membership = self.modifier(membership)
-            # Ensure membership stays in [0, 1]
-            modified_membership = max(0.0, min(1.0, modified_membership))
-            yield (doc, modified_membership)
+        batch = self._fresh_batch_evaluate()
+        if batch is not None:
+            yield from self._materialize(batch)
+            return
+        
+        yield from self._fused_scan()
+    
+    def _step(self) -> Callable[[Any, float], float]:
+        modifier = self.modifier
+        # Ensure membership stays in [0, 1]
+        return lambda doc, membership: max(0.0, min(1.0, modifier(membership)))
+    
+    def _root_columns(self) -> Optional[ColumnStore]:
+        return self.source._root_columns()
+    
+    def _batch_evaluate(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        batch = self.source._batch_evaluate()
+        if batch is None:
+            return None
+        rows, memberships = batch
+        
+        if self.dtype == np.uint8:
+            # Only 256 degrees exist; modify each once and look them up
+            if self._table is None:
+                self._table = quantize_membership(self._modify(np.arange(256) / 255.0))
+            return rows, np.take(self._table, memberships)
+        return rows, self._modify(memberships)
+    
+    def _modify(self, memberships: np.ndarray) -> np.ndarray:
+        """Apply the modifier to an array of float membership degrees."""
+        # The built-in modifiers are arithmetic and apply to the whole array
+        modified = self.modifier(memberships)
+        if not (isinstance(modified, np.ndarray) and modified.shape == memberships.shape):
+            modified = np.fromiter((self.modifier(m) for m in memberships.tolist()),
+                                   dtype=np.float64, count=len(memberships))
+        # Ensure membership stays in [0, 1]
+        return np.clip(modified, 0.0, 1.0)
     
     def _describe_pipeline(self) -> str:
         return f"{self.modifier_name}() → {self.source._describe_pipeline()}"
@@ -435,15 +838,37 @@ class FuzzyThresholdStream(FuzzyLazyStream):
             "min_membership": min_membership,
             "inner_source": source.source
         }
-        super().__init__(threshold_source, source.collection_id)
+        super().__init__(threshold_source, source.collection_id, source.dtype)
         self.min_membership = min_membership
         self.source = source
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Filter by minimum membership."""
-        for doc, membership in self.source.evaluate():
-            if membership >= self.min_membership:
-                yield (doc, membership)
+        batch = self._fresh_batch_evaluate()
+        if batch is not None:
+            yield from self._materialize(batch)
+            return
+        
+        yield from self._fused_scan()
+    
+    def _step(self) -> Callable[[Any, float], Optional[float]]:
+        min_membership = self.min_membership
+        return lambda doc, membership: (membership if membership >= min_membership
+                                        else None)
+    
+    def _root_columns(self) -> Optional[ColumnStore]:
+        return self.source._root_columns()
+    
+    def _batch_evaluate(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        batch = self.source._batch_evaluate()
+        if batch is None:
+            return None
+        rows, memberships = batch
+        min_membership = self.min_membership
+        if self.dtype == np.uint8:
+            min_membership = min_membership * 255
+        keep = memberships >= min_membership
+        return rows[keep], memberships[keep]
     
     def _describe_pipeline(self) -> str:
         return f"threshold({self.min_membership}) → {self.source._describe_pipeline()}"
@@ -467,12 +892,24 @@ class FuzzyTopKStream(FuzzyLazyStream):
             "k": k,
             "inner_source": source.source
         }
-        super().__init__(topk_source, source.collection_id)
+        super().__init__(topk_source, source.collection_id, source.dtype)
         self.k = k
         self.source = source
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Keep only top k by membership."""
+        batch = self._fresh_batch_evaluate()
+        if batch is not None:
+            yield from self._materialize(batch)
+            return
+        
+        if self.k >= 0:
+            # Keep a heap of the k best while scanning; like the stable sort
+            # below, ties keep their stream order
+            yield from heapq.nlargest(self.k, self.source.evaluate(),
+                                      key=itemgetter(1))
+            return
+        
         # Need to collect all items to find top k
         all_items = list(self.source.evaluate())
         
@@ -483,46 +920,84 @@ class FuzzyTopKStream(FuzzyLazyStream):
         for item in sorted_items[:self.k]:
             yield item
     
+    def _root_columns(self) -> Optional[ColumnStore]:
+        return self.source._root_columns()
+    
+    def _batch_evaluate(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        if self.k < 0:
+            # Negative k slices from the end; leave that to the generic path
+            return None
+        batch = self.source._batch_evaluate()
+        if batch is None:
+            return None
+        rows, memberships = batch
+        
+        n, k = len(memberships), self.k
+        if k == 0:
+            selected = np.arange(0)
+        elif k < n:
+            # Select in O(n): everything above the k-th largest degree, then
+            # ties at that degree in stream order, as a stable sort would
+            kth = np.partition(memberships, n - k)[n - k]
+            above = np.flatnonzero(memberships > kth)
+            ties = np.flatnonzero(memberships == kth)[:k - len(above)]
+            selected = np.sort(np.concatenate([above, ties]))
+        else:
+            selected = np.arange(n)
+        # Negate in float so unsigned degrees do not wrap around
+        order = selected[np.argsort(-memberships[selected].astype(np.float64),
+                                    kind="stable")]
+        return rows[order], memberships[order]
+    
     def _describe_pipeline(self) -> str:
         return f"top_k({self.k}) → {self.source._describe_pipeline()}"
 
 
 class FuzzyIntersectionStream(FuzzyLazyStream):
     """
-    Fuzzy intersection of two streams (minimum membership).
+    Fuzzy intersection of two streams (minimum or product membership).
     """
     
-    def __init__(self, left: FuzzyLazyStream, right: FuzzyLazyStream):
+    def __init__(self, left: FuzzyLazyStream, right: FuzzyLazyStream,
+                 tnorm: str = "min"):
         """
         Create intersection stream.
         
         Args:
             left: First stream
             right: Second stream
+            tnorm: Name of the t-norm in `TNORMS`
         """
+        if tnorm not in TNORMS:
+            raise ValueError(f"Unknown t-norm: {tnorm}")
         intersect_source = {
             "type": "fuzzy_intersection",
+            "tnorm": tnorm,
             "left": left.source,
             "right": right.source
         }
-        super().__init__(intersect_source, left.collection_id)
+        super().__init__(intersect_source, left.collection_id, left.dtype)
         self.left = left
         self.right = right
+        self.tnorm = tnorm
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Compute fuzzy intersection."""
+        left_items, right_items = _evaluate_branches(self.left, self.right)
+        
         # Collect right stream into dict for lookup
         right_dict = {}
-        for doc, membership in self.right.evaluate():
+        for doc, membership in right_items:
             key = self._make_hashable(doc)
             right_dict[key] = membership
         
-        # Stream left, taking minimum with right
-        for doc, left_membership in self.left.evaluate():
+        # Stream left, combining with right
+        t_norm = TNORMS[self.tnorm][0]
+        for doc, left_membership in left_items:
             key = self._make_hashable(doc)
             if key in right_dict:
-                # Fuzzy AND: minimum membership
-                combined = min(left_membership, right_dict[key])
+                # Fuzzy AND: minimum (or product) membership
+                combined = t_norm(left_membership, right_dict[key])
                 yield (doc, combined)
     
     def _describe_pipeline(self) -> str:
@@ -531,46 +1006,55 @@ class FuzzyIntersectionStream(FuzzyLazyStream):
 
 class FuzzyUnionStream(FuzzyLazyStream):
     """
-    Fuzzy union of two streams (maximum membership).
+    Fuzzy union of two streams (maximum or probabilistic sum membership).
     """
     
-    def __init__(self, left: FuzzyLazyStream, right: FuzzyLazyStream):
+    def __init__(self, left: FuzzyLazyStream, right: FuzzyLazyStream,
+                 tnorm: str = "min"):
         """
         Create union stream.
         
         Args:
             left: First stream
             right: Second stream
+            tnorm: Name of the t-norm in `TNORMS` whose dual t-conorm
+                combines memberships
         """
+        if tnorm not in TNORMS:
+            raise ValueError(f"Unknown t-norm: {tnorm}")
         union_source = {
             "type": "fuzzy_union",
+            "tnorm": tnorm,
             "left": left.source,
             "right": right.source
         }
-        super().__init__(union_source, left.collection_id)
+        super().__init__(union_source, left.collection_id, left.dtype)
         self.left = left
         self.right = right
+        self.tnorm = tnorm
     
     def evaluate(self) -> Generator[Tuple[Any, float], None, None]:
         """Compute fuzzy union."""
-        seen = {}
+        left_items, right_items = _evaluate_branches(self.left, self.right)
         
-        # Process left stream
-        for doc, membership in self.left.evaluate():
+        # Collect right stream first so shared documents can be combined
+        right_items = [(self._make_hashable(doc), doc, membership)
+                       for doc, membership in right_items]
+        right_dict = {key: membership for key, _, membership in right_items}
+        
+        # Process left stream, combining with right
+        t_conorm = TNORMS[self.tnorm][1]
+        seen = set()
+        for doc, membership in left_items:
             key = self._make_hashable(doc)
-            seen[key] = membership
+            seen.add(key)
+            if key in right_dict:
+                membership = t_conorm(membership, right_dict[key])
             yield (doc, membership)
         
-        # Process right stream, taking maximum with left
-        for doc, right_membership in self.right.evaluate():
-            key = self._make_hashable(doc)
-            if key in seen:
-                # Already yielded, but update if right has higher membership
-                if right_membership > seen[key]:
-                    # Note: Can't update already yielded value in generator
-                    # This is a limitation of streaming approach
-                    pass
-            else:
+        # Then the documents only in the right stream
+        for key, doc, right_membership in right_items:
+            if key not in seen:
                 yield (doc, right_membership)
     
     def _describe_pipeline(self) -> str:
@@ -578,14 +1062,16 @@ class FuzzyUnionStream(FuzzyLazyStream):
 
 
 # Convenience function to create fuzzy streams
-def fuzzy_stream(source: Union[str, Path, List, Dict[str, Any]]) -> FuzzyLazyStream:
+def fuzzy_stream(source: Union[str, Path, List, Dict[str, Any]],
+                 dtype: Any = np.float64) -> FuzzyLazyStream:
     """
     Create a fuzzy lazy stream from a data source.
     
     Args:
         source: File path, list of documents, or source dict
+        dtype: float64, or uint8 for quantized in-memory evaluation
         
     Returns:
         FuzzyLazyStream ready for operations
     """
-    return FuzzyLazyStream(source)
\ No newline at end of file
+    return FuzzyLazyStream(source, dtype=dtype)
\ No newline at end of file
@@ -3,8 +3,13 @@ Enhanced membership functions for fuzzy logic operations.
 Provides common fuzzy membership functions used in fuzzy predicates.
 """
 
+import math
 import numpy as np
-from typing import Union, Callable
+from typing import Union, Callable, Optional
+from ._kernels import HAVE_NUMBA, MIN_DOCS
+
+if HAVE_NUMBA:
+    from numba import vectorize
 
 
 def triangular_membership(x: float, a: float, b: float, c: float) -> float:
@@ -26,34 +31,12 @@ def triangular_membership(x: float, a: float, b: float, c: float) -> float:
     --------
     float : Membership degree in [0, 1]
     """
-    # Handle special case where all points are the same
-    if a == b == c:
-        return 1.0 if x == a else 0.0
-
-    # Handle special case where it's a vertical line at b
-    if a == b:
-        if x == a:
-            return 1.0
-        elif x > b and x < c:
-            return (c - x) / (c - b)
-        else:
-            return 0.0
-
-    if b == c:
-        if x == c:
-            return 1.0
-        elif x > a and x < b:
-            return (x - a) / (b - a)
-        else:
-            return 0.0
-
-    # Normal case
-    if x <= a or x >= c:
-        return 0.0
-    elif a < x <= b:
-        return (x - a) / (b - a)
-    else:  # b < x < c
-        return (c - x) / (c - b)
+    # The membership is the lower of the rising and falling edges, clamped
+    # to [0, 1], which avoids branching on x. A zero-width edge is a
+    # vertical line at b, a step.
+    rise = (x - a) / (b - a) if b > a else (1.0 if x >= b else 0.0)
+    fall = (c - x) / (c - b) if c > b else (1.0 if x <= b else 0.0)
+    return max(0.0, min(rise, fall, 1.0))
 
 
 def trapezoidal_membership(x: float, a: float, b: float, c: float, d: float) -> float:
@@ -77,28 +60,11 @@ def trapezoidal_membership(x: float, a: float, b: float, c: float, d: float) ->
     --------
     float : Membership degree in [0, 1]
     """
-    # Handle special case: rectangular membership
-    if a == b and c == d:
-        if a <= x <= c:
-            return 1.0
-        else:
-            return 0.0
-
-    # Normal trapezoidal case
-    if x < a or x > d:
-        return 0.0
-    elif a <= x < b:
-        if b == a:  # Vertical edge
-            return 1.0 if x == a else 0.0
-        return (x - a) / (b - a)
-    elif b <= x <= c:
-        return 1.0
-    elif c < x <= d:
-        if d == c:  # Vertical edge
-            return 1.0 if x == c else 0.0
-        return (d - x) / (d - c)
-    else:
-        return 0.0
+    # As for triangular_membership, with the plateau between b and c left
+    # at the clamp of 1. A zero-width edge is a vertical step.
+    rise = (x - a) / (b - a) if b > a else (1.0 if x >= a else 0.0)
+    fall = (d - x) / (d - c) if d > c else (1.0 if x <= d else 0.0)
+    return max(0.0, min(rise, fall, 1.0))
 
 
 def gaussian_membership(x: float, mean: float, sigma: float) -> float:
@@ -118,9 +84,13 @@ def gaussian_membership(x: float, mean: float, sigma: float) -> float:
     --------
     float : Membership degree in [0, 1]
     """
-    if sigma == 0:
-        return 1.0 if x == mean else 0.0
-    return np.exp(-0.5 * ((x - mean) / sigma) ** 2)
+    # The common case first; sigma == 0 is an impulse at the mean
+    if sigma:
+        t = -0.5 * ((x - mean) / sigma) ** 2
+        # math.exp is the faster for a Python float; np.exp keeps array
+        # inputs working
+        return math.exp(t) if type(t) is float else np.exp(t)
+    return 1.0 if x == mean else 0.0
 
 
 def sigmoid_membership(x: float, a: float, c: float) -> float:
@@ -162,9 +132,247 @@ def bell_membership(x: float, a: float, b: float, c: float) -> float:
     --------
     float : Membership degree in [0, 1]
     """
+    # The common case first; a == 0 is an impulse at the center
+    if a:
+        return 1.0 / (1.0 + abs((x - c) / a) ** (2 * b))
+    return 1.0 if x == c else 0.0
+
+
+# Vectorized membership functions
+#
+# Each evaluates its scalar counterpart above element-wise over an array of
+# inputs: the piecewise functions, with Numba installed, as the scalar
+# function compiled into a ufunc, and otherwise in a few NumPy passes. Parameters are scalars, as in
+# the scalar versions, and must be ordered (a <= b <= c [<= d]).
+#
+# From MIN_DOCS inputs on, the compiled ufuncs are the 'parallel' target
+# ones, which release the GIL and split the array across Numba's thread
+# pool (sized by NUMBA_NUM_THREADS).
+
+_UFUNCS = {}
+
+
+def _ufunc(scalar_fn: Callable[..., float], size: int = 0) -> Optional[np.ufunc]:
+    """
+    Returns a scalar membership function compiled by Numba into a float64
+    ufunc for `size` inputs, built on first use, or None if Numba is not
+    installed.
+    """
+    if not HAVE_NUMBA:
+        return None
+    target = 'parallel' if size >= MIN_DOCS else 'cpu'
+    ufunc = _UFUNCS.get((scalar_fn, target))
+    if ufunc is None:
+        nargs = scalar_fn.__code__.co_argcount
+        signature = f"f8({', '.join(['f8'] * nargs)})"
+        ufunc = _UFUNCS[scalar_fn, target] = vectorize(
+            [signature], target=target, cache=True)(scalar_fn)
+    return ufunc
+
+
+def triangular_membership_vec(x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    """
+    Triangular membership function over an array of inputs.
+
+    Parameters:
+    -----------
+    x : array_like
+        Input values
+    a, b, c : float
+        Left foot, peak and right foot, as in `triangular_membership`
+
+    Returns:
+    --------
+    ndarray : Membership degrees in [0, 1]
+    """
+    x = np.asarray(x, dtype=np.float64)
+    ufunc = _ufunc(triangular_membership, x.size)
+    if ufunc is not None:
+        return ufunc(x, a, b, c)
+    rise = (x - a) / (b - a) if b > a else np.where(x >= b, 1.0, 0.0)
+    fall = (c - x) / (c - b) if c > b else np.where(x <= b, 1.0, 0.0)
+    return np.clip(np.minimum(rise, fall), 0.0, 1.0)
+
+
+def trapezoidal_membership_vec(x: np.ndarray, a: float, b: float, c: float, d: float) -> np.ndarray:
+    """
+    Trapezoidal membership function over an array of inputs.
+
+    Parameters:
+    -----------
+    x : array_like
+        Input values
+    a, b, c, d : float
+        Left foot, left shoulder, right shoulder and right foot, as in
+        `trapezoidal_membership`
+
+    Returns:
+    --------
+    ndarray : Membership degrees in [0, 1]
+    """
+    x = np.asarray(x, dtype=np.float64)
+    ufunc = _ufunc(trapezoidal_membership, x.size)
+    if ufunc is not None:
+        return ufunc(x, a, b, c, d)
+    rise = (x - a) / (b - a) if b > a else np.where(x >= a, 1.0, 0.0)
+    fall = (d - x) / (d - c) if d > c else np.where(x <= d, 1.0, 0.0)
+    return np.clip(np.minimum(rise, fall), 0.0, 1.0)
+
+
+def gaussian_membership_vec(x: np.ndarray, mean: float, sigma: float,
+                            fast: bool = False) -> np.ndarray:
+    """
+    Gaussian membership function over an array of inputs.
+
+    Parameters:
+    -----------
+    x : array_like
+        Input values
+    mean, sigma : float
+        Center and standard deviation, as in `gaussian_membership`
+    fast : bool
+        If True, compute the exponential in float32 and return float32, to
+        within about 1e-7 of the exact degrees. x is still centered and
+        scaled in float64, so inputs far from zero keep their precision;
+        NumPy's exp runs twice as many float32 lanes, which is worth it for
+        large batches.
+
+    Returns:
+    --------
+    ndarray : Membership degrees in [0, 1]
+    """
+    dtype = np.float32 if fast else np.float64
+    x = np.asarray(x)
+    if sigma == 0:
+        return np.where(x == mean, dtype(1.0), dtype(0.0))
+    # NumPy's exp is SIMD-vectorized, so this beats a compiled scalar loop;
+    # the steps update a single temporary in place
+    y = np.subtract(x, mean, out=np.empty(x.shape), dtype=np.float64)
+    y /= sigma
+    if fast:
+        # Narrowed only once centered and scaled, which keeps (x - mean)
+        # exact where casting x itself would round away its low digits
+        y = y.astype(np.float32)
+    np.square(y, out=y)
+    y *= -0.5
+    return np.exp(y, out=y)
+
+
+def sigmoid_membership_vec(x: np.ndarray, a: float, c: float) -> np.ndarray:
+    """
+    Sigmoid membership function over an array of inputs.
+
+    Parameters:
+    -----------
+    x : array_like
+        Input values
+    a, c : float
+        Slope and crossover point, as in `sigmoid_membership`
+
+    Returns:
+    --------
+    ndarray : Membership degrees in [0, 1]
+    """
+    x = np.asarray(x, dtype=np.float64)
+    # Computed like gaussian_membership_vec; exp overflowing to inf gives the
+    # correct limit of 0
+    y = np.subtract(x, c, out=np.empty_like(x))
+    y *= -a
+    with np.errstate(over='ignore'):
+        np.exp(y, out=y)
+    y += 1.0
+    return np.reciprocal(y, out=y)
+
+
+def bell_membership_vec(x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    """
+    Generalized bell-shaped membership function over an array of inputs.
+
+    Parameters:
+    -----------
+    x : array_like
+        Input values
+    a, b, c : float
+        Width, shape and center, as in `bell_membership`
+
+    Returns:
+    --------
+    ndarray : Membership degrees in [0, 1]
+    """
+    x = np.asarray(x, dtype=np.float64)
     if a == 0:
-        return 1.0 if x == c else 0.0
-    return 1.0 / (1.0 + abs((x - c) / a) ** (2 * b))
+        return np.where(x == c, 1.0, 0.0)
+    # Computed in place, like gaussian_membership_vec, which beats the
+    # compiled scalar function
+    r = np.subtract(x, c, out=np.empty_like(x))
+    r /= a
+    power = 2 * b
+    if power in (2, 4, 8):
+        # The common shapes b = 1, 2, 4 by repeated squaring, each pass far
+        # cheaper than pow; even powers need no abs()
+        while power > 1:
+            np.square(r, out=r)
+            power //= 2
+    else:
+        np.abs(r, out=r)
+        np.power(r, power, out=r)
+    r += 1.0
+    return np.reciprocal(r, out=r)
+
+
+# Quantized membership degrees
+#
+# For large filtering workloads, membership degrees can be stored as uint8
+# levels 0..255 (level / 255 is the degree, to within 1/510). Fuzzy AND and
+# OR are then min and max on bytes, which NumPy runs 32 or more lanes at a
+# time and over an eighth of the memory of float64.
+
+def quantize_membership(membership: np.ndarray) -> np.ndarray:
+    """
+    Quantizes membership degrees to uint8 levels.
+
+    Parameters:
+    -----------
+    membership : array_like
+        Membership degrees, clipped to [0, 1]. NaN degrees quantize to 0,
+        no membership.
+
+    Returns:
+    --------
+    ndarray : uint8 levels, the degrees times 255, rounded to nearest
+    """
+    # Unlike clip, fmax returns its other argument for NaN, so NaN becomes 0
+    # without an invalid cast
+    levels = np.fmin(np.fmax(membership, 0.0), 1.0) * 255.0
+    return np.rint(levels).astype(np.uint8)
+
+
+def dequantize_membership(levels: np.ndarray) -> np.ndarray:
+    """
+    Converts uint8 levels from `quantize_membership` back to membership
+    degrees in [0, 1].
+    """
+    return np.asarray(levels, dtype=np.float64) / 255.0
+
+
+def fuzzy_and_u8(*levels: np.ndarray) -> np.ndarray:
+    """
+    Fuzzy AND (minimum) of one or more arrays of uint8 levels.
+    """
+    result = np.array(levels[0], dtype=np.uint8)
+    for other in levels[1:]:
+        np.minimum(result, np.asarray(other, dtype=np.uint8), out=result)
+    return result
+
+
+def fuzzy_or_u8(*levels: np.ndarray) -> np.ndarray:
+    """
+    Fuzzy OR (maximum) of one or more arrays of uint8 levels.
+    """
+    result = np.array(levels[0], dtype=np.uint8)
+    for other in levels[1:]:
+        np.maximum(result, np.asarray(other, dtype=np.uint8), out=result)
+    return result
 
 
 # Fuzzy comparison functions using membership functions
@@ -312,7 +520,7 @@ def very(membership: float) -> float:
     Linguistic hedge 'very' - intensifies membership.
     very(A) = A^2
     """
-    return membership ** 2
+    return membership * membership
 
 
 def somewhat(membership: float) -> float:
@@ -320,6 +528,9 @@ def somewhat(membership: float) -> float:
     Linguistic hedge 'somewhat' - dilutes membership.
     somewhat(A) = sqrt(A)
     """
+    # math.sqrt is the faster for a float, but rejects arrays
+    if type(membership) is float:
+        return math.sqrt(membership)
     return membership ** 0.5
 
 
@@ -336,11 +547,68 @@ def extremely(membership: float) -> float:
     Linguistic hedge 'extremely' - strongly intensifies membership.
     extremely(A) = A^3
     """
-    return membership ** 3
+    return membership * membership * membership
+
+
+def very_vec(membership: np.ndarray) -> np.ndarray:
+    """
+    Linguistic hedge 'very' over an array of membership degrees.
+    """
+    return np.square(membership)
+
+
+def somewhat_vec(membership: np.ndarray) -> np.ndarray:
+    """
+    Linguistic hedge 'somewhat' over an array of membership degrees.
+    """
+    return np.sqrt(membership)
+
+
+def slightly_vec(membership: np.ndarray) -> np.ndarray:
+    """
+    Linguistic hedge 'slightly' over an array of membership degrees.
+    """
+    return np.power(membership, 0.1)
+
+
+def extremely_vec(membership: np.ndarray) -> np.ndarray:
+    """
+    Linguistic hedge 'extremely' over an array of membership degrees.
+    """
+    membership = np.asarray(membership, dtype=np.float64)
+    return membership * membership * membership
 
 
 # Factory function for creating custom membership functions
 
+# Integer powers up to this are written out as repeated multiplication
+_MAX_INT_POWER = 8
+
+
+def _literal(value: float) -> str:
+    """
+    Returns the source literal of a membership function parameter.
+    """
+    value = float(value)
+    return repr(value) if math.isfinite(value) else f"float('{value}')"
+
+
+def _specialize(name: str, body: str, **params) -> Callable[[float], float]:
+    """
+    Compiles a one-argument membership function from the source of its body,
+    with the given parameters substituted into it as float literals.
+
+    The result has no closure: each call runs straight-line code against
+    constants, rather than looking up the captured parameters and calling
+    the general function.
+    """
+    literals = {key: _literal(value) for key, value in params.items()}
+    source = f"def {name}(x):\n" + body.format(**literals)
+    namespace = {'math': math, 'np': np}
+    exec(source, namespace)
+    return namespace[name]
+
+
 def create_membership_function(
     func_type: str,
     **params
@@ -357,33 +625,84 @@ def create_membership_function(
 
     Returns:
     --------
-    Callable : A membership function that takes a single float and returns membership degree
+    Callable : A membership function that takes a single float and returns membership degree.
+        Its `vectorized` attribute is the same function over an array of inputs, returning
+        an array of membership degrees. The Gaussian and sigmoid functions also accept arrays
+        themselves, as the general functions do, but `vectorized` is the faster array API.
 
     Examples:
     ---------
     >>> young = create_membership_function('trapezoidal', a=0, b=0, c=25, d=35)
     >>> middle_aged = create_membership_function('gaussian', mean=45, sigma=10)
     >>> old = create_membership_function('sigmoid', a=0.1, c=65)
+    >>> degrees = old.vectorized(np.array([20, 45, 70]))
     """
+    # The branches of the scalar functions that depend only on the
+    # parameters are taken here, once, rather than on every call
     if func_type == 'triangular':
         a, b, c = params['a'], params['b'], params['c']
-        return lambda x: triangular_membership(x, a, b, c)
+        rise = "(x - {a}) / {ba}" if b > a else "(1.0 if x >= {b} else 0.0)"
+        fall = "({c} - x) / {cb}" if c > b else "(1.0 if x <= {b} else 0.0)"
+        fn = _specialize(
+            'triangular',
+            f"    return max(0.0, min({rise}, {fall}, 1.0))\n",
+            a=a, b=b, c=c, ba=b - a, cb=c - b)
+        fn.vectorized = lambda x: triangular_membership_vec(x, a, b, c)
 
     elif func_type == 'trapezoidal':
         a, b, c, d = params['a'], params['b'], params['c'], params['d']
-        return lambda x: trapezoidal_membership(x, a, b, c, d)
+        rise = "(x - {a}) / {ba}" if b > a else "(1.0 if x >= {a} else 0.0)"
+        fall = "({d} - x) / {dc}" if d > c else "(1.0 if x <= {d} else 0.0)"
+        fn = _specialize(
+            'trapezoidal',
+            f"    return max(0.0, min({rise}, {fall}, 1.0))\n",
+            a=a, d=d, ba=b - a, dc=d - c)
+        fn.vectorized = lambda x: trapezoidal_membership_vec(x, a, b, c, d)
 
     elif func_type == 'gaussian':
         mean, sigma = params['mean'], params['sigma']
-        return lambda x: gaussian_membership(x, mean, sigma)
+        if sigma == 0:
+            body = "    return 1.0 if x == {mean} else 0.0\n"
+        else:
+            # math.exp for a float, np.exp for an array, as in
+            # gaussian_membership
+            body = ("    t = -0.5 * ((x - {mean}) / {sigma}) ** 2\n"
+                    "    return math.exp(t) if type(t) is float else np.exp(t)\n")
+        fn = _specialize('gaussian', body, mean=mean, sigma=sigma)
+        fn.vectorized = lambda x: gaussian_membership_vec(x, mean, sigma)
 
     elif func_type == 'sigmoid':
         a, c = params['a'], params['c']
-        return lambda x: sigmoid_membership(x, a, c)
+        # math.exp raises on overflow where np.exp returns inf, and the
+        # membership is 0.0 either way; NaN fails the bound and stays NaN.
+        # Arrays, which cannot be compared with the bound, take np.exp.
+        fn = _specialize(
+            'sigmoid',
+            "    t = {slope} * (x - {c})\n"
+            "    if type(t) is float:\n"
+            "        return 0.0 if t >= 709.0 else 1.0 / (1.0 + math.exp(t))\n"
+            "    with np.errstate(over='ignore'):\n"
+            "        return 1.0 / (1.0 + np.exp(t))\n",
+            slope=-a, c=c)
+        fn.vectorized = lambda x: sigmoid_membership_vec(x, a, c)
 
     elif func_type == 'bell':
         a, b, c = params['a'], params['b'], params['c']
-        return lambda x: bell_membership(x, a, b, c)
+        power = 2 * b
+        if a == 0:
+            body = "    return 1.0 if x == {c} else 0.0\n"
+        elif math.isfinite(power) and power == int(power) and 1 <= power <= _MAX_INT_POWER:
+            # Small integer powers as repeated multiplication; even powers
+            # need no abs()
+            ratio = "(x - {c}) / {a}" if power % 2 == 0 else "abs((x - {c}) / {a})"
+            body = (f"    r = {ratio}\n"
+                    f"    return 1.0 / (1.0 + {'*'.join(['r'] * int(power))})\n")
+        else:
+            body = "    return 1.0 / (1.0 + abs((x - {c}) / {a}) ** {power})\n"
+        fn = _specialize('bell', body, a=a, c=c, power=power)
+        fn.vectorized = lambda x: bell_membership_vec(x, a, b, c)
 
     else:
-        raise ValueError(f"Unknown membership function type: {func_type}")
\ No newline at end of file
+        raise ValueError(f"Unknown membership function type: {func_type}")
+
+    return fn
\ No newline at end of file
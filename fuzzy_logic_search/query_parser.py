@@ -15,7 +15,34 @@ Examples:
 
 import re
 import json
+import functools
+import numpy as np
 from typing import Any, List, Union
+from .fuzzy_query import _freeze, _thaw
+
+
+# Token patterns, tried in order at each position. Quoted strings run to the
+# next matching quote and are scanned by the regex engine; backslashes in
+# them are kept verbatim, so regex patterns such as "^\d{3}$" need no
+# double escaping.
+_TOKEN_PATTERNS = [
+    r'\(',                    # Left paren
+    r'\)',                    # Right paren
+    r'"[^"]*"',              # Quoted string
+    r"'[^']*'",              # Single-quoted string
+    r':[a-zA-Z_][\w\-\.]*',  # Field accessor :field-name
+    r'@[a-zA-Z_][\w\-\.]*',  # Path accessor @field.path
+    r'-?\d+\.\d+',           # Float numbers (must come before int)
+    r'-?\d+',                # Integer numbers
+    r'[\w\-\?\!]+',          # Identifiers and operators
+    r'[<>=]+',               # Comparison operators
+]
+
+# All tokens are found in a single scan by the regex engine
+_TOKEN_RE = re.compile('|'.join(f'(?:{p})' for p in _TOKEN_PATTERNS))
+
+# Keyword literals, matched case-insensitively
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'nil': None}
 
 
 class FuzzyQueryParser:
@@ -23,11 +50,6 @@ class FuzzyQueryParser:
     Parser for Lisp-like fuzzy query syntax.
     """
     
-    def __init__(self):
-        """Initialize the parser."""
-        self.tokens = []
-        self.current = 0
-    
     def parse(self, query_string: str) -> List:
         """
         Parse a Lisp-like query string into JSON AST.
@@ -45,19 +67,34 @@ class FuzzyQueryParser:
             >>> parser.parse("(and (>= :age 25) (contains? :name smith))")
             ["and", [">=", ":age", 25], ["contains?", ":name", "smith"]]
         """
-        self.tokens = self._tokenize(query_string)
-        self.current = 0
+        tokens = self._tokenize(query_string)
         
-        if not self.tokens:
+        if not tokens:
             return []
         
-        result = self._parse_expression()
-        
-        # Ensure we consumed all tokens
-        if self.current < len(self.tokens):
-            raise SyntaxError(f"Unexpected tokens after expression: {self.tokens[self.current:]}")
+        # Build the expression with an explicit stack of open lists, so
+        # nesting depth is not limited by the recursion limit
+        stack = []
+        for i, token in enumerate(tokens):
+            if token == '(':
+                stack.append([])
+                continue
+            if token == ')':
+                if not stack:
+                    raise SyntaxError("Unexpected ')'")
+                expr = stack.pop()
+            else:
+                expr = self._parse_atom(token)
+            
+            if stack:
+                stack[-1].append(expr)
+            elif i + 1 < len(tokens):
+                # Ensure we consumed all tokens
+                raise SyntaxError(f"Unexpected tokens after expression: {tokens[i + 1:]}")
+            else:
+                return expr
         
-        return result
+        raise SyntaxError("Missing closing parenthesis")
     
     def _tokenize(self, query_string: str) -> List[str]:
         """
@@ -69,120 +106,39 @@ class FuzzyQueryParser:
         Returns:
             List of tokens
         """
-        # Token patterns
-        patterns = [
-            r'\(',                    # Left paren
-            r'\)',                    # Right paren
-            r'"[^"]*"',              # Quoted string
-            r"'[^']*'",              # Single-quoted string
-            r':[a-zA-Z_][\w\-\.]*',  # Field accessor :field-name
-            r'@[a-zA-Z_][\w\-\.]*',  # Path accessor @field.path
-            r'-?\d+\.\d+',           # Float numbers (must come before int)
-            r'-?\d+',                # Integer numbers
-            r'[\w\-\?\!]+',          # Identifiers and operators
-            r'[<>=]+',               # Comparison operators
-        ]
-        
-        token_regex = '|'.join(f'({p})' for p in patterns)
-        tokens = []
-        
-        for match in re.finditer(token_regex, query_string):
-            token = match.group(0)
-            if token:
-                tokens.append(token)
-        
-        return tokens
-    
-    def _parse_expression(self) -> Any:
-        """
-        Parse a single expression (atom or list).
-        
-        Returns:
-            Parsed expression
-        """
-        if self.current >= len(self.tokens):
-            raise SyntaxError("Unexpected end of input")
-        
-        token = self.tokens[self.current]
-        
-        if token == '(':
-            # Parse list expression
-            return self._parse_list()
-        else:
-            # Parse atom
-            return self._parse_atom()
-    
-    def _parse_list(self) -> List:
-        """
-        Parse a list expression (op arg1 arg2 ...).
-        
-        Returns:
-            List representing the expression
-        """
-        # Consume opening paren
-        if self.tokens[self.current] != '(':
-            raise SyntaxError(f"Expected '(' but got {self.tokens[self.current]}")
-        self.current += 1
-        
-        result = []
-        
-        # Parse elements until closing paren
-        while self.current < len(self.tokens) and self.tokens[self.current] != ')':
-            result.append(self._parse_expression())
-        
-        # Consume closing paren
-        if self.current >= len(self.tokens):
-            raise SyntaxError("Missing closing parenthesis")
-        if self.tokens[self.current] != ')':
-            raise SyntaxError(f"Expected ')' but got {self.tokens[self.current]}")
-        self.current += 1
-        
-        return result
+        return _TOKEN_RE.findall(query_string)
     
-    def _parse_atom(self) -> Any:
+    def _parse_atom(self, token: str) -> Any:
         """
         Parse an atomic value (number, string, identifier).
         
+        Args:
+            token: Token other than a parenthesis
+            
         Returns:
             Parsed atomic value
         """
-        if self.current >= len(self.tokens):
-            raise SyntaxError("Unexpected end of input")
+        # Dispatch on the first character, so each token is only tested
+        # against the kinds of atom that can start with it
+        first = token[0]
         
-        token = self.tokens[self.current]
-        self.current += 1
+        # Number. The tokenizer matches numbers before identifiers, so a token
+        # starting with a digit, or a minus sign and a digit, is a number
+        if first.isdecimal() or (first == '-' and token[1:2].isdecimal()):
+            return float(token) if '.' in token else int(token)
         
         # Quoted string
-        if token.startswith('"') and token.endswith('"'):
-            return token[1:-1]  # Remove quotes
-        elif token.startswith("'") and token.endswith("'"):
-            return token[1:-1]  # Remove quotes
-        
-        # Field accessor (:field-name)
-        elif token.startswith(':'):
-            return token  # Keep the : prefix
-        
-        # Path accessor (@field.path)
-        elif token.startswith('@'):
-            return token  # Keep the @ prefix
-        
-        # Number - try float first, then int
-        elif re.match(r'^-?\d+\.\d+$', token):
-            return float(token)
-        elif re.match(r'^-?\d+$', token):
-            return int(token)
-        
-        # Boolean
-        elif token.lower() == 'true':
-            return True
-        elif token.lower() == 'false':
-            return False
+        elif first == '"' or first == "'":
+            if token[-1] == first:
+                return token[1:-1]  # Remove quotes
+            return token
         
-        # Null/nil
-        elif token.lower() in ('null', 'nil'):
-            return None
+        # Boolean, null/nil
+        elif first in 'tTfFnN' and token.lower() in _KEYWORDS:
+            return _KEYWORDS[token.lower()]
         
-        # Operator or identifier
+        # Field accessor (:field-name), path accessor (@field.path), operator
+        # or identifier, all kept as they are
         else:
             return token
 
@@ -192,6 +148,26 @@ class FuzzyQueryFormatter:
     Formatter to convert JSON AST to Lisp-like syntax.
     """
     
+    # Operators are written bare, never quoted
+    OPERATORS = frozenset({
+        # Logical
+        "and", "or", "not",
+        # Comparison
+        "==", "!=", ">", "<", ">=", "<=",
+        "eq?", "neq?", "gt?", "lt?", "gte?", "lte?",
+        # String
+        "contains?", "starts-with?", "ends-with?", "regex?", "in?",
+        # Fuzzy modifiers
+        "very", "somewhat", "slightly", "extremely",
+        # Field operations
+        "field", "path", "exists?",
+        # Quantifiers
+        "all", "any", "none"
+    })
+    
+    # Strings containing any of these are quoted
+    _QUOTED_CHARS = frozenset(' ()[]{}"\',')
+    
     def format(self, ast: Any, pretty: bool = False, indent: int = 0) -> str:
         """
         Format a JSON AST as Lisp-like syntax.
@@ -211,76 +187,91 @@ class FuzzyQueryFormatter:
             >>> formatter.format(["and", [">=", ":age", 25], ["contains?", ":name", "smith"]])
             '(and (>= :age 25) (contains? :name smith))'
         """
-        if ast is None:
-            return "nil"
+        buf = []
+        if pretty:
+            self._emit_pretty(ast, buf, indent)
+        else:
+            self._emit(ast, buf)
+        return ''.join(buf)
+    
+    def _emit(self, ast: Any, buf: List[str]) -> None:
+        """Append the compact formatting of an AST to buf."""
+        # Exact type checks first: the parser only produces plain lists and
+        # the atom types in _ATOM_HANDLERS
+        t = type(ast)
+        if t is list:
+            if not ast:
+                buf.append("()")
+                return
+            buf.append("(")
+            self._emit(ast[0], buf)
+            for i in range(1, len(ast)):
+                buf.append(" ")
+                self._emit(ast[i], buf)
+            buf.append(")")
+        elif t in self._ATOM_HANDLERS:
+            buf.append(self._ATOM_HANDLERS[t](self, ast))
+        elif isinstance(ast, list):
+            self._emit(list(ast), buf)
+        else:
+            buf.append(self._format_atom(ast))
+    
+    def _emit_pretty(self, ast: Any, buf: List[str], indent: int) -> None:
+        """Append the indented formatting of an AST to buf."""
+        # Atoms, empty lists and expressions that fit on one line are compact
+        if (type(ast) is not list and not isinstance(ast, list)) or not ast \
+                or self._is_simple_expr(ast):
+            self._emit(ast, buf)
+            return
+        
+        # Multi-line formatting: first element (operator) on the same line,
+        # the rest indented one level, each on its own line
+        buf.append("(")
+        self._emit(ast[0], buf)
+        next_indent_str = "\n" + "  " * (indent + 1)
+        for elem in ast[1:]:
+            buf.append(next_indent_str)
+            self._emit_pretty(elem, buf, indent + 1)
+        buf.append("\n" + "  " * indent + ")")
+    
+    def _format_atom(self, ast: Any) -> str:
+        """Format an AST node other than a list."""
+        # The exact types the parser produces are dispatched in one lookup
+        handler = self._ATOM_HANDLERS.get(type(ast))
+        if handler is not None:
+            return handler(self, ast)
         elif isinstance(ast, bool):
             return "true" if ast else "false"
         elif isinstance(ast, (int, float)):
             return str(ast)
         elif isinstance(ast, str):
-            # Check if it's a field/path accessor or operator
-            if ast.startswith(':') or ast.startswith('@') or self._is_operator(ast):
-                return ast
-            # Check if string needs quoting
-            elif ' ' in ast or any(c in ast for c in '()[]{}"\','):
-                return f'"{ast}"'
-            else:
-                return ast
-        elif isinstance(ast, list):
-            if not ast:
-                return "()"
-            
-            if pretty:
-                # Pretty printing with indentation
-                indent_str = "  " * indent
-                next_indent_str = "  " * (indent + 1)
-                
-                # Check if it's a simple expression that fits on one line
-                if self._is_simple_expr(ast):
-                    elements = [self.format(e, pretty=False) for e in ast]
-                    return f"({' '.join(elements)})"
-                else:
-                    # Multi-line formatting
-                    lines = []
-                    lines.append("(")
-                    
-                    # First element (operator) on same line
-                    if ast:
-                        lines[-1] += self.format(ast[0], pretty=False)
-                    
-                    # Rest of elements indented
-                    for elem in ast[1:]:
-                        formatted = self.format(elem, pretty=True, indent=indent+1)
-                        lines.append(f"{next_indent_str}{formatted}")
-                    
-                    lines.append(f"{indent_str})")
-                    return "\n".join(lines)
-            else:
-                # Compact formatting
-                elements = [self.format(e, pretty=False) for e in ast]
-                return f"({' '.join(elements)})"
+            return self._format_string(ast)
         else:
             # Fallback to JSON for unknown types
             return json.dumps(ast)
     
+    def _format_string(self, ast: str) -> str:
+        """Format a string atom, quoting it if needed."""
+        # Check if it's a field/path accessor or operator
+        if ast.startswith(':') or ast.startswith('@') or self._is_operator(ast):
+            return ast
+        # Check if string needs quoting
+        elif not self._QUOTED_CHARS.isdisjoint(ast):
+            return f'"{ast}"'
+        else:
+            return ast
+    
+    _ATOM_HANDLERS = {
+        type(None): lambda self, ast: "nil",
+        bool: lambda self, ast: "true" if ast else "false",
+        int: lambda self, ast: str(ast),
+        float: lambda self, ast: str(ast),
+        str: _format_string,
+    }
+    
     def _is_operator(self, s: str) -> bool:
         """Check if a string is an operator."""
-        operators = {
-            # Logical
-            "and", "or", "not",
-            # Comparison
-            "==", "!=", ">", "<", ">=", "<=",
-            "eq?", "neq?", "gt?", "lt?", "gte?", "lte?",
-            # String
-            "contains?", "starts-with?", "ends-with?", "regex?", "in?",
-            # Fuzzy modifiers
-            "very", "somewhat", "slightly", "extremely",
-            # Field operations
-            "field", "path", "exists?",
-            # Quantifiers
-            "all", "any", "none"
-        }
-        return s in operators
+        return s in self.OPERATORS
     
     def _is_simple_expr(self, ast: List) -> bool:
         """Check if expression is simple enough for one line."""
@@ -292,6 +283,21 @@ class FuzzyQueryFormatter:
 
 # Convenience functions
 
+# Neither class keeps per-instance state, so one instance of each serves
+# every call
+_PARSER = FuzzyQueryParser()
+_FORMATTER = FuzzyQueryFormatter()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(query_string: str) -> Any:
+    """
+    Parses a query string, memoized by the query string. Returns a frozen AST
+    (nested tuples), so that cached results cannot be mutated by callers.
+    """
+    return _freeze(_PARSER.parse(query_string))
+
+
 def parse_fuzzy_query(query_string: str) -> List:
     """
     Parse a Lisp-like fuzzy query string to JSON AST.
@@ -308,8 +314,7 @@ def parse_fuzzy_query(query_string: str) -> List:
         >>> parse_fuzzy_query("(very (contains? :name smith))")
         ["very", ["contains?", ":name", "smith"]]
     """
-    parser = FuzzyQueryParser()
-    return parser.parse(query_string)
+    return _thaw(_parse_cached(query_string))
 
 
 def format_fuzzy_query(ast: Any, pretty: bool = False) -> str:
@@ -329,8 +334,32 @@ def format_fuzzy_query(ast: Any, pretty: bool = False) -> str:
         >>> format_fuzzy_query(["and", [">=", ":age", 25], ["contains?", ":name", "smith"]])
         '(and (>= :age 25) (contains? :name smith))'
     """
-    formatter = FuzzyQueryFormatter()
-    return formatter.format(ast, pretty=pretty)
+    return _FORMATTER.format(ast, pretty=pretty)
+
+
+# Queries at least this long are checked for unclosed lists by a byte scan
+# before being parsed
+_SCAN_MIN = 256
+
+
+def _is_unclosed(query_string: str) -> bool:
+    """
+    Checks, without tokenizing, whether a query opens a list that it never
+    closes, which parsing would report as a missing closing parenthesis.
+    
+    Only gives True when that is certain: the query starts with '(' and the
+    nesting depth, counted over its bytes, never returns to 0 after that.
+    Queries with quotes, which may hide parentheses, always give False.
+    """
+    if '"' in query_string or "'" in query_string:
+        return False
+    data = query_string.encode('utf-8').lstrip()
+    if not data.startswith(b'('):
+        return False
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # Opens minus closes, as a running count in one vectorized pass
+    step = (buf == ord('(')).view(np.int8) - (buf == ord(')')).view(np.int8)
+    return bool(np.cumsum(step, dtype=np.int64).min() > 0)
 
 
 def validate_query_syntax(query_string: str) -> tuple[bool, str]:
@@ -344,6 +373,8 @@ def validate_query_syntax(query_string: str) -> tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
+        if len(query_string) >= _SCAN_MIN and _is_unclosed(query_string):
+            return (False, "Missing closing parenthesis")
         parse_fuzzy_query(query_string)
         return (True, "")
     except SyntaxError as e:
@@ -398,6 +429,9 @@ class FuzzyQueryBuilder:
         ...     .build())
     """
     
+    # Builders are often made one per query, so skip the instance __dict__
+    __slots__ = ('stack', 'current')
+    
     def __init__(self):
         """Initialize query builder."""
         self.stack = []
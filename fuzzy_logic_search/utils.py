@@ -1,4 +1,19 @@
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, List, Tuple
+
+
+@lru_cache(maxsize=256)
+def _compile_path(field_path: str) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Splits a field path into its fields once per distinct path.
+
+    Returns:
+        Tuple[Tuple[str, ...], bool]: The fields, and whether any of them is
+        a wildcard.
+    """
+    fields = tuple(field_path.split('.'))
+    return fields, ('*' in fields or '**' in fields)
+
 
 def get_values_by_field_path(obj: Any, field_path: str) -> List[Any]:
     """
@@ -67,7 +82,18 @@ def get_values_by_field_path(obj: Any, field_path: str) -> List[Any]:
 
         return results
 
-    fields = field_path.split('.')
+    fields, has_wildcard = _compile_path(field_path)
+
+    if not has_wildcard:
+        # Fast path: a chain of dicts resolves to a single value
+        cur_obj = obj
+        for field in fields:
+            if type(cur_obj) is not dict or field not in cur_obj:
+                break
+            cur_obj = cur_obj[field]
+        else:
+            return [cur_obj]
+
     raw_results = recursive_get(obj, fields)
 
     # Remove duplicates while preserving order
@@ -0,0 +1,125 @@
+"""
+Tests for the document corpus.
+"""
+
+import os
+import tempfile
+import unittest
+from collections.abc import Mapping
+
+from fuzzy_logic_search.corpus import Corpus
+
+
+class TestCorpus(unittest.TestCase):
+    """Test loading corpora and corpus set operations."""
+    
+    def setUp(self):
+        """Write a directory of small and large text files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = self.tmpdir.name
+        self.files = {
+            "small.txt": b"one\r\ntwo\rthree\n",
+            "large.txt": b"line\r\n" * 2000,
+            "notes.md": b"# notes\n",
+        }
+        for name, data in self.files.items():
+            with open(os.path.join(self.dir, name), "wb") as f:
+                f.write(data)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_load(self):
+        """Test loading files with their metadata."""
+        corpus = Corpus()
+        corpus.load(self.dir)
+        self.assertEqual(set(corpus), set(self.files))
+        doc = corpus["notes.md"]
+        self.assertEqual(doc.content, "# notes\n")
+        self.assertEqual(doc.metadata["extension"], ".md")
+        self.assertEqual(doc.metadata["size"], len(self.files["notes.md"]))
+        self.assertEqual(doc.metadata["path"], os.path.join(self.dir, "notes.md"))
+        
+        # Only matching extensions are loaded
+        corpus = Corpus(regex_ext=r"\.md")
+        corpus.load(self.dir)
+        self.assertEqual(list(corpus), ["notes.md"])
+    
+    def test_lazy_decode(self):
+        """Test that large files are only read on first access."""
+        corpus = Corpus(mmap_threshold=4096)
+        corpus.load(self.dir)
+        large = corpus["large.txt"]
+        self.assertIsNone(large._content)
+        self.assertEqual(large.content, "line\n" * 2000)
+        self.assertIsInstance(large._content, str)
+        self.assertIsNotNone(corpus["small.txt"]._content)
+    
+    def test_crlf_translated(self):
+        """Test that line endings are translated as in text mode."""
+        for threshold in (0, 1 << 20):
+            corpus = Corpus(mmap_threshold=threshold)
+            corpus.load(self.dir)
+            self.assertEqual(corpus["small.txt"].content, "one\ntwo\nthree\n")
+            self.assertNotIn("\r", corpus["large.txt"].content)
+    
+    def test_set_operations(self):
+        """Test difference, intersection, union and symmetric difference."""
+        a, b = Corpus(), Corpus()
+        for name in ("x", "y"):
+            a.add(name, f"a-{name}")
+        for name in ("y", "z"):
+            b.add(name, f"b-{name}")
+        
+        self.assertEqual(set(a - b), {"x"})
+        self.assertEqual(set(a & b), {"y"})
+        self.assertEqual((a & b)["y"].content, "a-y")
+        self.assertEqual(set(a | b), {"x", "y", "z"})
+        self.assertEqual((a | b)["y"].content, "b-y")
+        self.assertEqual(set(a ^ b), {"x", "z"})
+        self.assertEqual((a ^ b)["z"].content, "b-z")
+        self.assertTrue(a == a | Corpus())
+        self.assertTrue(a != b)
+
+    def test_set_operations_keep_order(self):
+        """Test that set operations keep the documents in insertion order."""
+        a, b = Corpus(), Corpus()
+        names = [f"doc{i:02d}" for i in range(40)]
+        for i, name in reversed(list(enumerate(names))):
+            a.add(name, name, metadata={"size": i})
+        for name in names[::3] + ["extra1", "extra0"]:
+            b.add(name, name)
+        
+        in_b = set(names[::3])
+        self.assertEqual(list(a - b), [n for n in reversed(names) if n not in in_b])
+        self.assertEqual(list(a & b), [n for n in reversed(names) if n in in_b])
+        self.assertEqual(list(a ^ b),
+                         [n for n in reversed(names) if n not in in_b] + ["extra1", "extra0"])
+        self.assertEqual((a - b).sizes.tolist(), [int(n[3:]) for n in a - b])
+    
+    def test_where(self):
+        """Test selecting documents by a mask over their sizes."""
+        corpus = Corpus()
+        corpus.load(self.dir)
+        large = corpus.where(corpus.sizes > 4096)
+        self.assertEqual(list(large), ["large.txt"])
+        with self.assertRaises(ValueError):
+            corpus.where([True])
+
+    def test_document_mapping(self):
+        """Test that a document still reads like the dictionary it was."""
+        corpus = Corpus()
+        corpus.load(self.dir)
+        doc = corpus.corpus["notes.md"]
+        self.assertIsInstance(doc, Mapping)
+        self.assertEqual(list(doc.keys()), ["content", "metadata"])
+        self.assertIn("content", doc)
+        self.assertNotIn("size", doc)
+        self.assertEqual(doc.get("content"), doc.content)
+        self.assertIsNone(doc.get("size"))
+        self.assertEqual(dict(doc)["metadata"], doc.metadata)
+        self.assertEqual(len({doc, doc}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
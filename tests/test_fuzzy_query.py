@@ -0,0 +1,255 @@
+"""
+Tests for the FuzzyQuery string parser and evaluator.
+"""
+
+import random
+import unittest
+import numpy as np
+from fuzzy_logic_search import _kernels
+from fuzzy_logic_search.fuzzy_query import FuzzyQuery, to_dnf
+
+
+class TreeWalkQuery(FuzzyQuery):
+    """FuzzyQuery with its own operator tables, which disables DNF evaluation."""
+    unary_ops = dict(FuzzyQuery.unary_ops)
+    nary_ops = dict(FuzzyQuery.nary_ops)
+
+
+class TestFuzzyQueryParse(unittest.TestCase):
+    """Tests for parsing query strings into ASTs."""
+
+    def test_parse_explicit_operator(self):
+        """Test parsing a fully parenthesized query."""
+        q = FuzzyQuery("(or (and cat dog) (not (very (or fish bird))))")
+        self.assertEqual(
+            q.ast,
+            ["or", ["and", "cat", "dog"], ["not", ["very", ["or", "fish", "bird"]]]]
+        )
+
+    def test_parse_implicit_and(self):
+        """Test that operator-less groups default to AND."""
+        self.assertEqual(FuzzyQuery("cat dog (not fish)").ast,
+                         ["and", "cat", "dog", ["not", "fish"]])
+        self.assertEqual(FuzzyQuery("(cat dog)").ast, ["and", "cat", "dog"])
+
+    def test_parse_operator_case_insensitive(self):
+        """Test that operators are normalized to lowercase."""
+        self.assertEqual(FuzzyQuery("(OR cat dog)").ast, ["or", "cat", "dog"])
+
+    def test_parse_trailing_terms(self):
+        """Test that terms after a top-level group are kept."""
+        self.assertEqual(FuzzyQuery("(or cat dog) fish").ast,
+                         ["and", ["or", "cat", "dog"], "fish"])
+
+    def test_parse_deeply_nested(self):
+        """Test parsing deeply nested queries."""
+        depth = 200
+        q = FuzzyQuery("(not " * depth + "cat" + ")" * depth)
+        node = q.ast
+        for _ in range(depth):
+            self.assertEqual(node[0], "not")
+            node = node[1]
+        self.assertEqual(node, "cat")
+
+    def test_parse_errors(self):
+        """Test that malformed queries raise ValueError."""
+        for query in ["", "()", "(cat dog", "cat dog)"]:
+            with self.assertRaises(ValueError):
+                FuzzyQuery(query)
+
+    def test_parse_cache_returns_independent_asts(self):
+        """Test that mutating a parsed AST does not leak into later parses."""
+        q1 = FuzzyQuery("(or cat dog)")
+        q1.ast.append("fish")
+        q2 = FuzzyQuery("(or cat dog)")
+        self.assertEqual(q2.ast, ["or", "cat", "dog"])
+
+    def test_str_roundtrip(self):
+        """Test that str() produces a query string that parses back."""
+        for query in ["(or (and cat dog) (not (very (or fish bird))))",
+                      "cat dog (not fish)"]:
+            q = FuzzyQuery(query)
+            self.assertEqual(FuzzyQuery(str(q)).ast, q.ast)
+        self.assertEqual(str(FuzzyQuery("(or cat (not dog))")), "(or cat (not dog))")
+
+
+class TestFuzzyQueryEval(unittest.TestCase):
+    """Tests for evaluating queries against documents."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.docs = [["cat", "dog"], ["fish"], ["cat"], []]
+
+    def test_eval_crisp(self):
+        """Test evaluation with the default crisp membership function."""
+        q = FuzzyQuery("(or (and cat dog) fish)")
+        self.assertEqual(list(q.eval(self.docs)), [1.0, 1.0, 0.0, 0.0])
+
+    def test_eval_operators(self):
+        """Test that query operators map to fuzzy set operations."""
+        cat, dog = FuzzyQuery("cat"), FuzzyQuery("dog")
+        self.assertEqual((cat & dog)(self.docs), cat(self.docs) & dog(self.docs))
+        self.assertEqual((cat | dog)(self.docs), cat(self.docs) | dog(self.docs))
+        self.assertEqual((~cat)(self.docs), ~cat(self.docs))
+
+    def test_eval_custom_membership(self):
+        """Test evaluation with a graded membership function."""
+        scores = {"cat": 0.5, "dog": 0.8}
+        membership_fn = lambda term, doc: scores.get(term, 0.0)
+        q = FuzzyQuery("(very cat)")
+        self.assertAlmostEqual(q.eval([None], membership_fn)[0], 0.25)
+
+    def test_eval_shared_subexpressions(self):
+        """Test that repeated subtrees are evaluated once per document."""
+        calls = []
+
+        def membership_fn(term, doc):
+            calls.append(term)
+            return 1.0 if term in doc else 0.0
+
+        for cls in (FuzzyQuery, TreeWalkQuery):
+            calls.clear()
+            q = cls("(and (very cat) (or (very cat) dog))")
+            result = q.eval(self.docs, membership_fn)
+            self.assertEqual(list(result), [1.0, 0.0, 1.0, 0.0])
+            self.assertEqual(calls.count("cat"), len(self.docs))
+
+    def test_eval_commutative_subexpressions(self):
+        """Test that reordered operands of commutative operators are shared."""
+        calls = []
+
+        def membership_fn(term, doc):
+            calls.append(term)
+            return 0.5
+
+        for cls in (FuzzyQuery, TreeWalkQuery):
+            calls.clear()
+            q = cls("(or (not (and cat dog)) (very (and dog cat)))")
+            q.eval([None], membership_fn)
+            self.assertEqual(sorted(calls), ["cat", "dog"])
+
+    def test_eval_dnf_matches_tree_walk(self):
+        """Test that DNF evaluation agrees with the tree walk."""
+        rng = random.Random(42)
+        terms = ["cat", "dog", "fish", "bird"]
+        docs = [{t: rng.random() for t in terms} for _ in range(50)]
+        membership_fn = lambda term, doc: doc[term]
+        queries = [
+            "(or (and cat dog) (not (very (or fish bird))))",
+            "(not (and (somewhat cat) (or dog (not fish))))",
+            "(extremely (or (slightly (and cat bird)) (very (not dog))))",
+            "(and (or cat dog) (or fish bird) (or cat bird) (or dog fish))",
+        ]
+        for query in queries:
+            dnf = FuzzyQuery(query).eval(docs, membership_fn)
+            walk = TreeWalkQuery(query).eval(docs, membership_fn)
+            self.assertEqual(dnf, walk)
+            # Far inside FuzzySet's tolerance, which is not what makes them equal
+            np.testing.assert_allclose(dnf.memberships, walk.memberships,
+                                       rtol=0, atol=1e-12)
+
+    def test_eval_dnf_large_corpus(self):
+        """Test DNF evaluation over enough documents to use the compiled kernel."""
+        rng = random.Random(7)
+        terms = ["cat", "dog", "fish"]
+        docs = [{t: rng.random() for t in terms}
+                for _ in range(_kernels.MIN_DOCS + 1)]
+        membership_fn = lambda term, doc: doc[term]
+        query = "(or (and cat (not dog)) (and (very fish) dog) (somewhat cat))"
+        self.assertEqual(FuzzyQuery(query).eval(docs, membership_fn),
+                         TreeWalkQuery(query).eval(docs, membership_fn))
+
+    def test_eval_dnf_float64(self):
+        """Test that DNF evaluation keeps full precision by default."""
+        docs = [{"a": 0.9999013268964848}]
+        membership_fn = lambda term, doc: doc[term]
+        q = FuzzyQuery(["slightly", ["not", "a"]])
+        expected = TreeWalkQuery(["slightly", ["not", "a"]]).eval(docs, membership_fn)
+        self.assertEqual(q.eval(docs, membership_fn)[0], expected[0])
+        self.assertEqual(q(docs, membership_fn)[0], expected[0])
+        # float32 is opt-in, and only approximate
+        fast = q.eval(docs, membership_fn, dtype=np.float32)
+        self.assertAlmostEqual(fast[0], expected[0], places=4)
+
+    def test_eval_large_dnf_falls_back(self):
+        """Test queries whose DNF is too large are still evaluated."""
+        pairs = " ".join(f"(or a{i} b{i})" for i in range(8))
+        q = FuzzyQuery(f"(and {pairs})")
+        doc = [f"a{i}" for i in range(8)]
+        self.assertEqual(list(q.eval([doc, ["a0"]])), [1.0, 0.0])
+
+    def test_eval_membership_fn_batch(self):
+        """Test that a batch membership function is called once per evaluation."""
+        rng = random.Random(3)
+        terms = ["cat", "dog", "fish"]
+        docs = [{t: rng.random() for t in terms} for _ in range(20)]
+        membership_fn = lambda term, doc: doc[term]
+        calls = []
+
+        def membership_fn_batch(terms, docs):
+            calls.append(terms)
+            return np.array([[doc[t] for doc in docs] for t in terms])
+
+        query = "(or (and cat (not dog)) (very fish))"
+        for cls in (FuzzyQuery, TreeWalkQuery):
+            calls.clear()
+            expected = cls(query).eval(docs, membership_fn)
+            result = cls(query).eval(docs, membership_fn_batch=membership_fn_batch)
+            self.assertEqual(result, expected)
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(sorted(calls[0]), sorted(terms))
+
+    def test_eval_vectorized_membership_fn(self):
+        """Test that a membership_fn marked vectorized is called in batch."""
+        def membership_fn(terms, docs):
+            return np.array([[1.0 if t in doc else 0.0 for doc in docs]
+                             for t in terms])
+        membership_fn.vectorized = True
+
+        q = FuzzyQuery("(or (and cat dog) fish)")
+        self.assertEqual(list(q.eval(self.docs, membership_fn)),
+                         [1.0, 1.0, 0.0, 0.0])
+
+    def test_eval_membership_fn_batch_shape(self):
+        """Test that a batch result of the wrong shape raises ValueError."""
+        with self.assertRaises(ValueError):
+            FuzzyQuery("(or cat dog)").eval(
+                self.docs, membership_fn_batch=lambda terms, docs: np.zeros(3))
+
+    def test_eval_unknown_operator(self):
+        """Test that unknown operators raise ValueError."""
+        with self.assertRaises(ValueError):
+            FuzzyQuery(["nand", "cat", "dog"]).eval(self.docs)
+
+    def test_eval_unary_arity(self):
+        """Test that unary operators require exactly one operand."""
+        with self.assertRaises(ValueError):
+            FuzzyQuery(["not", "cat", "dog"]).eval(self.docs)
+
+
+class TestToDnf(unittest.TestCase):
+    """Tests for normalizing ASTs into disjunctive normal form."""
+
+    def test_distributes_and_over_or(self):
+        """Test that AND distributes over OR."""
+        self.assertEqual(to_dnf(["and", ["or", "a", "b"], "c"]),
+                         ["or", ["and", "a", "c"], ["and", "b", "c"]])
+
+    def test_pushes_negation_to_terms(self):
+        """Test that NOT is pushed down with De Morgan's laws."""
+        self.assertEqual(to_dnf(["not", ["and", "a", ["very", "b"]]]),
+                         ["or", ["and", ["not", "a"]], ["and", ["not", ["very", "b"]]]])
+
+    def test_collapses_duplicates(self):
+        """Test that repeated literals and clauses are removed."""
+        self.assertEqual(to_dnf(["or", ["and", "a", "a"], "a"]),
+                         ["or", ["and", "a"]])
+
+    def test_unsupported_operator(self):
+        """Test that non-DNF operators raise ValueError."""
+        with self.assertRaises(ValueError):
+            to_dnf(["diff", "a", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ Tests all basic operations, properties, and edge cases.
 
 import unittest
 import pytest
+import numpy as np
+from fuzzy_logic_search import _kernels
 from fuzzy_logic_search.fuzzy_set import FuzzySet
 
 
@@ -22,7 +24,21 @@ class TestFuzzySetOperations(unittest.TestCase):
     def test_initialization(self):
         """Test FuzzySet initialization."""
         fs = FuzzySet([0.1, 0.5, 0.9])
-        self.assertEqual(fs.memberships, [0.1, 0.5, 0.9])
+        self.assertIsInstance(fs.memberships, np.ndarray)
+        self.assertEqual(fs.memberships.dtype, np.float64)
+        self.assertEqual(fs.memberships.tolist(), [0.1, 0.5, 0.9])
+
+    def test_initialization_from_iterables(self):
+        """Test initialization from generators and other iterables."""
+        values = [i / 20 for i in range(21)]
+        cases = [(iter(values), values), ((v for v in values), values),
+                 (tuple(values), values), (range(0, 2), [0.0, 1.0])]
+        for source, expected in cases:
+            fs = FuzzySet(source)
+            self.assertEqual(fs.memberships.dtype, np.float64)
+            self.assertEqual(fs.memberships.tolist(), expected)
+        with self.assertRaises(ValueError):
+            FuzzySet(v * 2 for v in values)
 
     def test_initialization_invalid_values(self):
         """Test that invalid membership values raise errors."""
@@ -30,6 +46,11 @@ class TestFuzzySetOperations(unittest.TestCase):
             FuzzySet([0.5, 1.2, 0.3])  # Value > 1
         with self.assertRaises(ValueError):
             FuzzySet([-0.1, 0.5, 0.3])  # Value < 0
+        with self.assertRaises(ValueError):
+            FuzzySet([0.5, float('nan')])  # Not a number
+        for bad in (1.2, -0.1, float('nan')):
+            with self.assertRaises(ValueError):
+                FuzzySet([0.5] * 20 + [bad])  # Beyond the small-set check
 
     def test_intersection(self):
         """Test fuzzy intersection (AND) operation."""
@@ -71,6 +92,17 @@ class TestFuzzySetOperations(unittest.TestCase):
         expected = FuzzySet([0.3, 0.1, 0.4, 0.2])
         self.assertEqual(result, expected)
 
+    def test_product_operations(self):
+        """Test the product t-norm and probabilistic sum."""
+        self.assertEqual(self.fs1.product_and(self.fs2),
+                         FuzzySet([0.56, 0.54, 0.12, 0.1]))
+        self.assertEqual(self.fs1.product_or(self.fs2),
+                         FuzzySet([0.94, 0.96, 0.58, 0.6]))
+        with self.assertRaises(ValueError):
+            self.fs1.product_and(FuzzySet([0.5]))
+        with self.assertRaises(ValueError):
+            self.fs1.product_or(FuzzySet([0.5]))
+
     def test_operations_with_mismatched_lengths(self):
         """Test that operations with mismatched lengths raise errors."""
         fs_short = FuzzySet([0.5, 0.5])
@@ -123,6 +155,8 @@ class TestFuzzySetSequenceProtocol(unittest.TestCase):
             self.fs[0] = 1.5
         with self.assertRaises(ValueError):
             self.fs[0] = -0.1
+        with self.assertRaises(ValueError):
+            self.fs[0] = float('nan')
 
     def test_len(self):
         """Test length operation."""
@@ -142,6 +176,13 @@ class TestFuzzySetSequenceProtocol(unittest.TestCase):
         self.assertFalse(0.9 in self.fs)
         self.assertFalse(0 in self.fs)
 
+    def test_contains_large(self):
+        """Test membership checks on a set beyond the small-set path."""
+        fs = FuzzySet([i / 100 for i in range(100)])
+        self.assertTrue(0.42 in fs)
+        self.assertFalse(0.425 in fs)
+        self.assertFalse("0.42" in fs)
+
 
 class TestFuzzySetComparison(unittest.TestCase):
     """Tests for FuzzySet comparison operations."""
@@ -168,6 +209,12 @@ class TestFuzzySetComparison(unittest.TestCase):
         fs2 = FuzzySet([0.5, 0.3, 0.8])
         self.assertNotEqual(fs1, fs2)
 
+    def test_equality_with_other_types(self):
+        """Test that a FuzzySet does not equal a non-FuzzySet."""
+        fs = FuzzySet([0.5, 0.3])
+        self.assertNotEqual(fs, [0.5, 0.3])
+        self.assertFalse(fs == None)
+
 
 class TestFuzzySetRepresentation(unittest.TestCase):
     """Tests for FuzzySet string representations."""
@@ -337,6 +384,37 @@ class TestFuzzySetEdgeCases(unittest.TestCase):
         result = ~fs1
         self.assertEqual(len(result), size)
 
+    def test_large_difference_operations(self):
+        """Test that fused difference operators match their definitions."""
+        import random
+        random.seed(7)
+
+        size = 1000
+        fs1 = FuzzySet([random.random() for _ in range(size)])
+        fs2 = FuzzySet([random.random() for _ in range(size)])
+
+        self.assertEqual(fs1 - fs2, fs1 & ~fs2)
+        self.assertEqual(fs1 ^ fs2, (fs1 & ~fs2) | (~fs1 & fs2))
+
+
+class TestFuzzySetKernels(unittest.TestCase):
+    """Test that the element-wise kernels match their NumPy fallbacks."""
+
+    def test_kernels_match_numpy(self):
+        """Test each kernel against its NumPy implementation."""
+        rng = np.random.default_rng(0)
+        for size in (0, 1, 7, 1000):
+            a, b = rng.random(size), rng.random(size)
+            for name in ("minimum", "maximum", "sub", "xor"):
+                out, expected = np.empty(size), np.empty(size)
+                getattr(_kernels, name)(a, b, out)
+                getattr(_kernels, "_np_" + name)(a, b, expected)
+                np.testing.assert_allclose(out, expected, atol=1e-12)
+            out, expected = np.empty(size), np.empty(size)
+            _kernels.complement(a, out)
+            _kernels._np_complement(a, expected)
+            np.testing.assert_allclose(out, expected, atol=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
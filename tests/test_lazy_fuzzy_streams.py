@@ -7,11 +7,13 @@ import json
 import tempfile
 import os
 from pathlib import Path
+import numpy as np
 
 from fuzzy_logic_search import (
     FuzzyLazyStream,
     fuzzy_stream,
-    fuzzy_eval
+    fuzzy_eval,
+    compile_fuzzy_query
 )
 
 
@@ -75,6 +77,23 @@ class TestFuzzyLazyStreams(unittest.TestCase):
             self.assertGreater(membership, 0)
             self.assertLessEqual(membership, 1.0)
     
+    def test_hedge(self):
+        """Test power hedges in batch and streaming evaluation."""
+        query = [">=", "@score", 85]
+        base = {d["name"]: m for d, m in
+                fuzzy_stream(self.test_docs).fuzzy_filter(query).evaluate()}
+        generated = {"type": "generator", "generator": lambda: iter(self.test_docs)}
+        for make_source in (lambda: self.test_docs, lambda: generated):
+            for p in (2, 0.5, 1.5):
+                stream = fuzzy_stream(make_source()).fuzzy_filter(query)
+                for doc, m in stream.hedge(p).evaluate():
+                    self.assertAlmostEqual(m, base[doc["name"]] ** p)
+            self.assertEqual(
+                list(fuzzy_stream(make_source()).fuzzy_filter(query).very().evaluate()),
+                list(fuzzy_stream(make_source()).fuzzy_filter(query).hedge(2).evaluate()))
+        with self.assertRaises(ValueError):
+            fuzzy_stream(self.test_docs).hedge(0)
+    
     def test_threshold_filtering(self):
         """Test threshold filtering by minimum membership."""
         stream = fuzzy_stream(self.test_docs)
@@ -142,6 +161,27 @@ class TestFuzzyLazyStreams(unittest.TestCase):
         # Union should have at least as many as intersection
         self.assertGreaterEqual(len(or_results), len(and_results))
     
+    def test_fuzzy_set_operations_tnorms(self):
+        """Test combining shared documents under the min and product t-norms."""
+        docs = [{"x": 79}, {"x": 100}, {"y": 1}]
+        left = fuzzy_stream(docs[:2]).fuzzy_filter([">=", "@x", 80])
+        right = fuzzy_stream(docs).fuzzy_filter(["or", ["exists?", "@y"],
+                                                 [">=", "@x", 80]]).very()
+        a = fuzzy_eval([">=", "@x", 80], docs[0])
+        b = a ** 2
+
+        self.assertEqual(list(left.fuzzy_and(right).evaluate()),
+                         [(docs[0], min(a, b)), (docs[1], 1.0)])
+        self.assertEqual(list(left.fuzzy_and(right, tnorm="product").evaluate()),
+                         [(docs[0], a * b), (docs[1], 1.0)])
+        self.assertEqual(list(left.fuzzy_or(right).evaluate()),
+                         [(docs[0], max(a, b)), (docs[1], 1.0), (docs[2], 1.0)])
+        union = list(left.fuzzy_or(right, tnorm="product").evaluate())
+        self.assertAlmostEqual(union[0][1], a + b - a * b)
+        self.assertEqual(union[1:], [(docs[1], 1.0), (docs[2], 1.0)])
+        with self.assertRaises(ValueError):
+            left.fuzzy_and(right, tnorm="lukasiewicz")
+
     def test_chained_operations(self):
         """Test chaining multiple operations."""
         stream = fuzzy_stream(self.test_docs)
@@ -190,6 +230,20 @@ class TestFuzzyLazyStreams(unittest.TestCase):
             # Clean up
             os.unlink(temp_file)
     
+    def test_file_streaming_blank_and_empty(self):
+        """Test streaming JSONL files with blank lines, and empty files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "docs.jsonl")
+            with open(path, "w") as f:
+                f.write("\n" + json.dumps(self.test_docs[0]) + "\n\n  \n"
+                        + json.dumps(self.test_docs[1]))
+            results = [doc for doc, _ in fuzzy_stream(path).evaluate()]
+            self.assertEqual(results, self.test_docs[:2])
+
+            empty = os.path.join(tmp, "empty.jsonl")
+            open(empty, "w").close()
+            self.assertEqual(list(fuzzy_stream(empty).evaluate()), [])
+
     def test_fuzzy_complement(self):
         """Test fuzzy NOT operation."""
         stream = fuzzy_stream(self.test_docs)
@@ -283,6 +337,173 @@ class TestFuzzyLazyStreams(unittest.TestCase):
         self.assertGreater(membership, 0)
         self.assertLessEqual(membership, 1.0)
 
+    def test_columnar_filter_matches_fuzzy_eval(self):
+        """Test that column-wise comparisons match per-document evaluation."""
+        import random
+        rng = random.Random(0)
+        docs = [{"x": rng.choice([rng.uniform(0, 100), rng.randint(0, 100)]),
+                 "user": {"age": rng.randint(15, 45)}} for _ in range(200)]
+        for op in ["==", "!=", ">", "<", ">=", "<=", "gte?", "lt?"]:
+            for query in ([op, "@x", 50], [op, "@user.age", 30], [op, ":x", 0.5]):
+                stream = fuzzy_stream(docs).fuzzy_filter(query)
+                self.assertIsNotNone(stream._column_degrees())
+                expected = [(d, fuzzy_eval(query, d)) for d in docs
+                            if fuzzy_eval(query, d) > 0]
+                results = list(stream.evaluate())
+                self.assertEqual([d for d, _ in results], [d for d, _ in expected])
+                for (_, m), (_, e) in zip(results, expected):
+                    self.assertAlmostEqual(m, e)
+
+    def test_columnar_filter_heterogeneous_fields(self):
+        """Test that mixed or missing fields fall back to per-document evaluation."""
+        docs = [{"score": 90}, {"score": "high"}, {"name": "Eve"}]
+        stream = fuzzy_stream(docs).fuzzy_filter([">=", "@score", 85])
+        self.assertIsNone(stream._column_degrees())
+        self.assertEqual(list(stream.evaluate()), [({"score": 90}, 1.0)])
+
+    def test_columnar_filter_infinite_values(self):
+        """Test that column-wise comparisons clamp infinite operands like fuzzy_eval."""
+        inf = float("inf")
+        docs = [{"x": inf}, {"x": -inf}, {"x": 5.0}, {"x": 1e308}]
+        for op in ["==", "!=", ">", "<", ">=", "<="]:
+            for right in (5, inf, -inf):
+                query = [op, "@x", right]
+                stream = fuzzy_stream(docs).fuzzy_filter(query)
+                degrees = stream._column_degrees()
+                self.assertFalse(np.isnan(degrees).any())
+                np.testing.assert_array_equal(degrees, [fuzzy_eval(query, d) for d in docs])
+
+    def test_columns_follow_source_changes(self):
+        """Test that columns are rebuilt for documents edited or appended between evaluations."""
+        docs = [{"age": 20}, {"age": 30}]
+        root = fuzzy_stream(docs)
+        list(root.fuzzy_filter([">=", "@age", 25]).evaluate())
+        np.testing.assert_array_equal(root.columns().column("age"), [20, 30])
+        
+        docs[0]["age"] = 50
+        docs.append({"age": 40})
+        list(root.fuzzy_filter([">=", "@age", 35]).evaluate())
+        np.testing.assert_array_equal(root.columns().column("age"), [50, 30, 40])
+
+    def test_batch_pipeline_matches_streaming(self):
+        """Test that in-memory batch evaluation matches document streaming."""
+        import random
+        rng = random.Random(1)
+        docs = [{"score": rng.choice([70, 79, 80, 85, 90]), "age": rng.randint(18, 60),
+                 "name": rng.choice(["Eve", "Bob"])} for _ in range(100)]
+        generated = {"type": "generator", "generator": lambda: iter(docs)}
+
+        pipelines = [
+            lambda s: s.fuzzy_filter([">=", "@score", 80]).very().threshold(0.2),
+            lambda s: s.fuzzy_filter(["or", ["<", "@age", 30],
+                                      ["==", "@name", "Eve"]]).top_k(10),
+            lambda s: s.fuzzy_filter([">", "@score", 79]).somewhat().top_k(7),
+            lambda s: s.fuzzy_filter(["<=", "@age", 40]).not_fuzzy().top_k(0),
+            lambda s: s.top_k(5).fuzzy_filter([">=", "@age", 30]),
+            lambda s: s.extremely().top_k(-3),
+        ]
+        for pipeline in pipelines:
+            self.assertEqual(list(pipeline(fuzzy_stream(docs)).evaluate()),
+                             list(pipeline(fuzzy_stream(generated)).evaluate()))
+        self.assertIsNotNone(pipelines[0](fuzzy_stream(docs))._batch_evaluate())
+        self.assertIsNone(pipelines[0](fuzzy_stream(generated))._batch_evaluate())
+
+    def test_uint8_memberships(self):
+        """Test that quantized evaluation stays within quantization error."""
+        import random
+        rng = random.Random(2)
+        docs = [{"id": i, "score": rng.uniform(60, 100)} for i in range(200)]
+        pipeline = lambda s: (s.fuzzy_filter([">=", "@score", 80]).very()
+                              .not_fuzzy().threshold(0.3))
+        exact = dict((d["id"], m) for d, m in pipeline(fuzzy_stream(docs)).evaluate())
+        quantized = list(pipeline(fuzzy_stream(docs, dtype=np.uint8)).evaluate())
+        self.assertTrue(quantized)
+        for doc, membership in quantized:
+            self.assertIsInstance(membership, float)
+            self.assertAlmostEqual(membership, exact.get(doc["id"], 0.3), delta=0.01)
+
+        top = list(fuzzy_stream(docs, dtype=np.uint8)
+                   .fuzzy_filter([">=", "@score", 80]).top_k(5).evaluate())
+        self.assertEqual([m for _, m in top], sorted((m for _, m in top), reverse=True))
+        with self.assertRaises(ValueError):
+            fuzzy_stream(docs, dtype=np.float32)
+
+    def test_filter_degrees_memoized(self):
+        """Test that a filter repeated within one evaluation is evaluated once."""
+        root = fuzzy_stream(self.test_docs)
+        query = ["or", ["==", "@name", "Eve"], ["<", "@age", 26]]
+        first = list(root.fuzzy_filter(query).evaluate())
+        
+        repeated = root.fuzzy_filter(["or", ["==", "@name", "Eve"], ["<", "@age", 26]])
+        repeated._compiled_query = None  # Would fail if the query were re-run
+        self.assertEqual(list(root.fuzzy_filter(query).fuzzy_or(repeated).evaluate()),
+                         first)
+    
+    def test_filter_degrees_follow_source_changes(self):
+        """Test that documents edited or appended between evaluations are re-scored."""
+        docs = [{"age": 20}, {"age": 30}]
+        for query in ([">=", "@age", 25], ["or", [">=", "@age", 25], ["exists?", "@x"]]):
+            with self.subTest(query=query):
+                docs[:] = [{"age": 20}, {"age": 30}]
+                stream = fuzzy_stream(docs).fuzzy_filter(query)
+                self.assertEqual([d for d, _ in stream.evaluate()], [{"age": 30}])
+                
+                docs[0]["age"] = 50
+                self.assertEqual([d for d, _ in stream.evaluate()],
+                                 [{"age": 50}, {"age": 30}])
+                
+                docs.append({"age": 40})
+                self.assertEqual([d for d, _ in stream.evaluate()],
+                                 [{"age": 50}, {"age": 30}, {"age": 40}])
+    
+    def test_parallel_branches_match_streaming(self):
+        """Test set operations on large in-memory sources against streaming."""
+        from fuzzy_logic_search import _kernels
+        docs = [{"id": i, "score": i % 100, "age": i % 50}
+                for i in range(_kernels.MIN_DOCS)]
+        generated = {"type": "generator", "generator": lambda: iter(docs)}
+
+        def pipeline(source):
+            stream = fuzzy_stream(source)
+            high = stream.fuzzy_filter([">=", "@score", 70])
+            young = stream.fuzzy_filter(["<", "@age", 20])
+            return [high.fuzzy_and(young), high.fuzzy_or(young, tnorm="product")]
+
+        for batched, streamed in zip(pipeline(docs), pipeline(generated)):
+            self.assertEqual(list(batched.evaluate()), list(streamed.evaluate()))
+
+    def test_shared_source_counted_once(self):
+        """Test that branches over one source count its documents once for threading."""
+        from unittest import mock
+        from fuzzy_logic_search import _kernels, lazy_fuzzy_streams
+        docs = [{"score": i % 100} for i in range(_kernels.MIN_DOCS // 2 + 1)]
+        generated = {"type": "generator", "generator": lambda: iter(docs)}
+
+        def pipeline(source):
+            stream = fuzzy_stream(source)
+            return stream.fuzzy_filter([">=", "@score", 70]).fuzzy_and(
+                stream.fuzzy_filter(["<", "@score", 90]))
+
+        with mock.patch.object(lazy_fuzzy_streams, "ThreadPoolExecutor") as executor:
+            results = list(pipeline(docs).evaluate())
+        executor.assert_not_called()
+        self.assertEqual(results, list(pipeline(generated).evaluate()))
+
+    def test_fused_streaming_stays_lazy(self):
+        """Test that fused per-document stages pull documents one at a time."""
+        pulled = []
+
+        def generator():
+            for doc in self.test_docs:
+                pulled.append(doc)
+                yield doc
+
+        stream = fuzzy_stream({"type": "generator", "generator": generator})
+        pipeline = stream.fuzzy_filter([">=", "@score", 90]).very().threshold(0.5)
+        doc, membership = next(pipeline.evaluate())
+        self.assertEqual(doc["name"], "Bob")
+        self.assertEqual(len(pulled), 2)
+
 
 class TestFuzzyEval(unittest.TestCase):
     """Test the fuzzy_eval function."""
@@ -371,6 +592,45 @@ class TestFuzzyEval(unittest.TestCase):
         membership = fuzzy_eval([">=", "@user.profile.age", 20], doc)
         self.assertGreater(membership, 0)
 
+    def test_compiled_query_matches_fuzzy_eval(self):
+        """Test that compiled queries agree with the interpreter."""
+        docs = [
+            {"name": "Alice", "age": 25, "score": 79, "tags": ["a", "b"]},
+            {"name": "Eve", "age": 35, "score": 95, "user": {"age": 40}},
+            {"name": 7, "age": "old"},
+            {},
+        ]
+        queries = [
+            ["or", ["and", [">=", "@age", 25], [">=", "@score", 85]],
+             ["starts-with?", "@name", "E"]],
+            ["very", ["not", ["<", "@score", 80]]],
+            ["somewhat", ["==", "@user.age", 40]],
+            ["and", "@name", ":tags", 0.5],
+            ["!=", "@name", "Alice"],
+            ["gt?", ["not", 0.2], 0.5],
+            ["exists?", "@user"],
+            ["field", "@tags"],
+            ["and"],
+            ["very"],
+            [">=", "@age"],
+            "@name",
+            2,
+            [],
+        ]
+        for query in queries:
+            compiled = compile_fuzzy_query(query)
+            for doc in docs:
+                self.assertEqual(compiled(doc), fuzzy_eval(query, doc),
+                                 msg=f"{query} on {doc}")
+
+    def test_compiled_query_deeply_nested(self):
+        """Test that queries too deep to compile are still evaluated."""
+        query = [">=", "@score", 80]
+        for _ in range(300):
+            query = ["not", query]
+        doc = {"score": 90}
+        self.assertEqual(compile_fuzzy_query(query)(doc), fuzzy_eval(query, doc))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
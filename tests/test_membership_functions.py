@@ -3,14 +3,21 @@ Comprehensive test suite for fuzzy membership functions.
 Tests all membership function types and their properties.
 """
 
+import math
 import unittest
 import numpy as np
+from fuzzy_logic_search.batch import score_categories
 from fuzzy_logic_search.membership_functions import (
     triangular_membership,
     trapezoidal_membership,
     gaussian_membership,
     sigmoid_membership,
     bell_membership,
+    triangular_membership_vec,
+    trapezoidal_membership_vec,
+    gaussian_membership_vec,
+    sigmoid_membership_vec,
+    bell_membership_vec,
     fuzzy_equal,
     fuzzy_greater_than,
     fuzzy_less_than,
@@ -21,38 +28,59 @@ from fuzzy_logic_search.membership_functions import (
     somewhat,
     slightly,
     extremely,
+    very_vec,
+    somewhat_vec,
+    slightly_vec,
+    extremely_vec,
+    quantize_membership,
+    dequantize_membership,
+    fuzzy_and_u8,
+    fuzzy_or_u8,
     create_membership_function
 )
 
 
+def assert_table(fn, cases):
+    """Assert fn(*inputs) == expected for each row (*inputs, expected) of a table."""
+    np.testing.assert_array_equal([fn(*case[:-1]) for case in cases],
+                                  [case[-1] for case in cases])
+
+
 class TestTriangularMembership(unittest.TestCase):
     """Tests for triangular membership function."""
 
     def test_triangular_basic(self):
         """Test basic triangular membership function."""
         # Triangle with peak at 5, feet at 3 and 7
-        self.assertEqual(triangular_membership(3, 3, 5, 7), 0.0)  # Left foot
-        self.assertEqual(triangular_membership(5, 3, 5, 7), 1.0)  # Peak
-        self.assertEqual(triangular_membership(7, 3, 5, 7), 0.0)  # Right foot
-        self.assertAlmostEqual(triangular_membership(4, 3, 5, 7), 0.5)  # Midpoint left
-        self.assertAlmostEqual(triangular_membership(6, 3, 5, 7), 0.5)  # Midpoint right
+        assert_table(triangular_membership, [
+            # x, a, b, c, expected
+            (3, 3, 5, 7, 0.0),  # Left foot
+            (5, 3, 5, 7, 1.0),  # Peak
+            (7, 3, 5, 7, 0.0),  # Right foot
+            (4, 3, 5, 7, 0.5),  # Midpoint left
+            (6, 3, 5, 7, 0.5),  # Midpoint right
+        ])
 
     def test_triangular_outside_range(self):
         """Test triangular membership outside the support range."""
-        self.assertEqual(triangular_membership(0, 3, 5, 7), 0.0)
-        self.assertEqual(triangular_membership(10, 3, 5, 7), 0.0)
+        assert_table(triangular_membership, [
+            (0, 3, 5, 7, 0.0),
+            (10, 3, 5, 7, 0.0),
+        ])
 
     def test_triangular_degenerate_cases(self):
         """Test edge cases with zero-width segments."""
-        # Spike at a single point
-        self.assertEqual(triangular_membership(5, 5, 5, 5), 1.0)  # At the spike
-        self.assertEqual(triangular_membership(4, 5, 5, 5), 0.0)  # Not at spike
-        # Vertical rise
-        self.assertEqual(triangular_membership(5, 5, 5, 7), 1.0)  # At peak
-        self.assertAlmostEqual(triangular_membership(6, 5, 5, 7), 0.5)  # Midway down
-        # Vertical fall
-        self.assertEqual(triangular_membership(5, 3, 5, 5), 1.0)  # At peak
-        self.assertAlmostEqual(triangular_membership(4, 3, 5, 5), 0.5)  # Midway up
+        assert_table(triangular_membership, [
+            # Spike at a single point
+            (5, 5, 5, 5, 1.0),  # At the spike
+            (4, 5, 5, 5, 0.0),  # Not at spike
+            # Vertical rise
+            (5, 5, 5, 7, 1.0),  # At peak
+            (6, 5, 5, 7, 0.5),  # Midway down
+            # Vertical fall
+            (5, 3, 5, 5, 1.0),  # At peak
+            (4, 3, 5, 5, 0.5),  # Midway up
+        ])
 
 
 class TestTrapezoidalMembership(unittest.TestCase):
@@ -61,29 +89,36 @@ class TestTrapezoidalMembership(unittest.TestCase):
     def test_trapezoidal_basic(self):
         """Test basic trapezoidal membership function."""
         # Trapezoid with plateau from 5 to 7
-        self.assertEqual(trapezoidal_membership(3, 3, 5, 7, 9), 0.0)  # Left foot
-        self.assertEqual(trapezoidal_membership(5, 3, 5, 7, 9), 1.0)  # Left shoulder
-        self.assertEqual(trapezoidal_membership(6, 3, 5, 7, 9), 1.0)  # Plateau
-        self.assertEqual(trapezoidal_membership(7, 3, 5, 7, 9), 1.0)  # Right shoulder
-        self.assertEqual(trapezoidal_membership(9, 3, 5, 7, 9), 0.0)  # Right foot
-        self.assertAlmostEqual(trapezoidal_membership(4, 3, 5, 7, 9), 0.5)  # Rising
-        self.assertAlmostEqual(trapezoidal_membership(8, 3, 5, 7, 9), 0.5)  # Falling
+        assert_table(trapezoidal_membership, [
+            # x, a, b, c, d, expected
+            (3, 3, 5, 7, 9, 0.0),  # Left foot
+            (5, 3, 5, 7, 9, 1.0),  # Left shoulder
+            (6, 3, 5, 7, 9, 1.0),  # Plateau
+            (7, 3, 5, 7, 9, 1.0),  # Right shoulder
+            (9, 3, 5, 7, 9, 0.0),  # Right foot
+            (4, 3, 5, 7, 9, 0.5),  # Rising
+            (8, 3, 5, 7, 9, 0.5),  # Falling
+        ])
 
     def test_trapezoidal_triangular_special_case(self):
         """Test that trapezoidal degenerates to triangular when b == c."""
         # Should behave like triangular
-        self.assertEqual(trapezoidal_membership(5, 3, 5, 5, 7), 1.0)
-        self.assertAlmostEqual(trapezoidal_membership(4, 3, 5, 5, 7), 0.5)
-        self.assertAlmostEqual(trapezoidal_membership(6, 3, 5, 5, 7), 0.5)
+        assert_table(trapezoidal_membership, [
+            (5, 3, 5, 5, 7, 1.0),
+            (4, 3, 5, 5, 7, 0.5),
+            (6, 3, 5, 5, 7, 0.5),
+        ])
 
     def test_trapezoidal_rectangular_special_case(self):
         """Test rectangular membership (vertical edges)."""
         # Rectangle from 3 to 7
-        self.assertEqual(trapezoidal_membership(2, 3, 3, 7, 7), 0.0)
-        self.assertEqual(trapezoidal_membership(3, 3, 3, 7, 7), 1.0)
-        self.assertEqual(trapezoidal_membership(5, 3, 3, 7, 7), 1.0)
-        self.assertEqual(trapezoidal_membership(7, 3, 3, 7, 7), 1.0)
-        self.assertEqual(trapezoidal_membership(8, 3, 3, 7, 7), 0.0)
+        assert_table(trapezoidal_membership, [
+            (2, 3, 3, 7, 7, 0.0),
+            (3, 3, 3, 7, 7, 1.0),
+            (5, 3, 3, 7, 7, 1.0),
+            (7, 3, 3, 7, 7, 1.0),
+            (8, 3, 3, 7, 7, 0.0),
+        ])
 
 
 class TestGaussianMembership(unittest.TestCase):
@@ -108,9 +143,12 @@ class TestGaussianMembership(unittest.TestCase):
 
     def test_gaussian_zero_sigma(self):
         """Test Gaussian with zero standard deviation (impulse)."""
-        self.assertEqual(gaussian_membership(5, 5, 0), 1.0)
-        self.assertEqual(gaussian_membership(4.999, 5, 0), 0.0)
-        self.assertEqual(gaussian_membership(5.001, 5, 0), 0.0)
+        assert_table(gaussian_membership, [
+            # x, mean, sigma, expected
+            (5, 5, 0, 1.0),
+            (4.999, 5, 0, 0.0),
+            (5.001, 5, 0, 0.0),
+        ])
 
     def test_gaussian_width_effect(self):
         """Test that wider Gaussian has slower decay."""
@@ -119,6 +157,14 @@ class TestGaussianMembership(unittest.TestCase):
         wide = gaussian_membership(x, mean, 3)
         self.assertGreater(wide, narrow)  # Wider Gaussian decays slower
 
+    def test_gaussian_array_input(self):
+        """Test that the scalar Gaussian still accepts arrays."""
+        x = np.array([3.0, 5.0, 7.0])
+        np.testing.assert_allclose(gaussian_membership(x, 5, 2),
+                                   gaussian_membership_vec(x, 5, 2))
+        np.testing.assert_allclose(fuzzy_close_to(x, 5, 2),
+                                   gaussian_membership_vec(x, 5, 2))
+
 
 class TestSigmoidMembership(unittest.TestCase):
     """Tests for sigmoid membership function."""
@@ -184,9 +230,137 @@ class TestBellMembership(unittest.TestCase):
 
     def test_bell_zero_width(self):
         """Test bell with zero width (impulse)."""
-        self.assertEqual(bell_membership(5, 0, 2, 5), 1.0)
-        self.assertEqual(bell_membership(4.999, 0, 2, 5), 0.0)
-        self.assertEqual(bell_membership(5.001, 0, 2, 5), 0.0)
+        assert_table(bell_membership, [
+            # x, a, b, c, expected
+            (5, 0, 2, 5, 1.0),
+            (4.999, 0, 2, 5, 0.0),
+            (5.001, 0, 2, 5, 0.0),
+        ])
+
+
+class TestVectorizedMembership(unittest.TestCase):
+    """Tests for the vectorized membership functions."""
+
+    def setUp(self):
+        """Set up a grid of inputs."""
+        self.x = np.linspace(0, 10, 81)
+
+    def assert_matches_scalar(self, vec_fn, scalar_fn, *params):
+        """Assert that a vectorized function agrees with its scalar version."""
+        expected = [scalar_fn(x, *params) for x in self.x.tolist()]
+        np.testing.assert_allclose(vec_fn(self.x, *params), expected)
+
+    def test_triangular_vec(self):
+        """Test vectorized triangular membership."""
+        np.testing.assert_allclose(
+            triangular_membership_vec(np.array([3, 4, 5, 6, 7, 0, 10]), 3, 5, 7),
+            [0, 0.5, 1, 0.5, 0, 0, 0])
+        for params in [(3, 5, 7), (5, 5, 5), (5, 5, 7), (3, 5, 5), (2.5, 2.5, 2.5)]:
+            self.assert_matches_scalar(triangular_membership_vec,
+                                       triangular_membership, *params)
+
+    def test_trapezoidal_vec(self):
+        """Test vectorized trapezoidal membership."""
+        np.testing.assert_allclose(
+            trapezoidal_membership_vec(np.array([3, 4, 5, 6, 7, 8, 9]), 3, 5, 7, 9),
+            [0, 0.5, 1, 1, 1, 0.5, 0])
+        for params in [(3, 5, 7, 9), (3, 5, 5, 7), (3, 3, 7, 7), (3, 3, 7, 9),
+                       (3, 5, 7, 7)]:
+            self.assert_matches_scalar(trapezoidal_membership_vec,
+                                       trapezoidal_membership, *params)
+
+    def test_gaussian_vec(self):
+        """Test vectorized Gaussian membership."""
+        for params in [(5, 2), (10, 3), (5, 0)]:
+            self.assert_matches_scalar(gaussian_membership_vec,
+                                       gaussian_membership, *params)
+
+    def test_gaussian_vec_fast(self):
+        """Test the float32 Gaussian is close to the exact one."""
+        for params in [(5, 2), (10, 3), (5, 0)]:
+            fast = gaussian_membership_vec(self.x, *params, fast=True)
+            self.assertEqual(fast.dtype, np.float32)
+            np.testing.assert_allclose(fast, gaussian_membership_vec(self.x, *params),
+                                       rtol=0, atol=1e-6)
+
+    def test_gaussian_vec_fast_far_from_zero(self):
+        """Test the float32 Gaussian keeps its precision for large inputs."""
+        x = np.array([1.7e9 - 3, 1.7e9, 1.7e9 + 3])
+        fast = gaussian_membership_vec(x, 1.7e9, 2, fast=True)
+        np.testing.assert_allclose(fast, [0.3246525, 1.0, 0.3246525], atol=1e-6)
+
+    def test_sigmoid_vec(self):
+        """Test vectorized sigmoid membership."""
+        for params in [(1, 5), (-1, 5), (10, 5.5)]:
+            self.assert_matches_scalar(sigmoid_membership_vec,
+                                       sigmoid_membership, *params)
+
+    def test_bell_vec(self):
+        """Test vectorized bell membership."""
+        for params in [(2, 2, 5), (3, 1, 5), (0, 2, 5), (2, 4, 5), (-2, 2, 5), (2, 1.5, 5)]:
+            self.assert_matches_scalar(bell_membership_vec,
+                                       bell_membership, *params)
+
+    def test_numpy_fallback_matches_compiled(self):
+        """Test that the NumPy implementations agree with the compiled ufuncs."""
+        from unittest import mock
+        from fuzzy_logic_search import membership_functions
+        cases = [(triangular_membership_vec, (3, 5, 7)), (triangular_membership_vec, (5, 5, 7)),
+                 (trapezoidal_membership_vec, (3, 5, 7, 9)), (trapezoidal_membership_vec, (3, 3, 7, 7)),
+                 (gaussian_membership_vec, (5, 2)), (sigmoid_membership_vec, (-1, 5)),
+                 (bell_membership_vec, (2, 2, 5))]
+        compiled = [fn(self.x, *params) for fn, params in cases]
+        with mock.patch.object(membership_functions, "HAVE_NUMBA", False):
+            for (fn, params), expected in zip(cases, compiled):
+                np.testing.assert_allclose(fn(self.x, *params), expected)
+
+    def test_vec_accepts_scalars_and_lists(self):
+        """Test that vectorized functions accept any array_like input."""
+        self.assertEqual(float(triangular_membership_vec(4, 3, 5, 7)), 0.5)
+        np.testing.assert_allclose(gaussian_membership_vec([5, 5], 5, 2), [1.0, 1.0])
+        self.assertEqual(float(gaussian_membership_vec(5, 5, 2)), 1.0)
+        self.assertEqual(float(sigmoid_membership_vec(5, 1, 5)), 0.5)
+        np.testing.assert_allclose(sigmoid_membership_vec([-1000, 1000], 1, 5), [0.0, 1.0])
+
+
+class TestQuantizedMembership(unittest.TestCase):
+    """Tests for uint8-quantized membership degrees."""
+
+    def test_quantize_roundtrip(self):
+        """Test quantization error is within half a level."""
+        degrees = np.linspace(0.0, 1.0, 1001)
+        levels = quantize_membership(degrees)
+        self.assertEqual(levels.dtype, np.uint8)
+        self.assertEqual(levels[0], 0)
+        self.assertEqual(levels[-1], 255)
+        error = np.abs(dequantize_membership(levels) - degrees)
+        self.assertLessEqual(error.max(), 0.5 / 255 + 1e-12)
+
+    def test_quantize_clips(self):
+        """Test out-of-range degrees are clipped."""
+        np.testing.assert_array_equal(quantize_membership([-0.5, 1.5]), [0, 255])
+
+    def test_quantize_nan(self):
+        """Test NaN degrees quantize to 0 without a warning."""
+        import warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            levels = quantize_membership([np.nan, 0.5, 1.0])
+        np.testing.assert_array_equal(levels, [0, 128, 255])
+
+    def test_and_or(self):
+        """Test AND/OR on levels match min/max on degrees."""
+        ages = np.array([20, 30, 45, 70])
+        young = trapezoidal_membership_vec(ages, 0, 0, 25, 35)
+        middle = gaussian_membership_vec(ages, 45, 10)
+        old = sigmoid_membership_vec(ages, 0.1, 65)
+        q = [quantize_membership(m) for m in (young, middle, old)]
+        np.testing.assert_array_equal(fuzzy_and_u8(*q), np.minimum.reduce(q))
+        np.testing.assert_array_equal(fuzzy_or_u8(*q), np.maximum.reduce(q))
+        np.testing.assert_allclose(dequantize_membership(fuzzy_or_u8(*q)),
+                                   np.maximum.reduce([young, middle, old]), atol=0.5 / 255)
+        # The inputs are left unchanged
+        np.testing.assert_array_equal(q[0], quantize_membership(young))
 
 
 class TestFuzzyComparisons(unittest.TestCase):
@@ -246,6 +420,7 @@ class TestLinguisticHedges(unittest.TestCase):
         self.assertEqual(somewhat(0.0), 0.0)
         self.assertAlmostEqual(somewhat(0.25), 0.5)
         self.assertAlmostEqual(somewhat(0.49), 0.7)
+        np.testing.assert_allclose(somewhat(np.array([0.25, 0.49])), [0.5, 0.7])
 
     def test_slightly(self):
         """Test 'slightly' hedge (strong dilution)."""
@@ -260,6 +435,15 @@ class TestLinguisticHedges(unittest.TestCase):
         self.assertEqual(extremely(0.5), 0.125)
         self.assertAlmostEqual(extremely(0.8), 0.512)
 
+    def test_hedges_vectorized(self):
+        """Test that array hedges agree with the scalar hedges."""
+        x = np.linspace(0.0, 1.0, 11)
+        for scalar_fn, vec_fn in [(very, very_vec), (somewhat, somewhat_vec),
+                                  (slightly, slightly_vec), (extremely, extremely_vec)]:
+            with self.subTest(hedge=scalar_fn.__name__):
+                expected = [scalar_fn(v) for v in x.tolist()]
+                np.testing.assert_allclose(vec_fn(x), expected, rtol=1e-12)
+
     def test_hedge_composition(self):
         """Test composition of hedges."""
         # Test with different value where difference is more pronounced
@@ -323,6 +507,45 @@ class TestMembershipFactory(unittest.TestCase):
         self.assertLess(bell(3), 1.0)
         self.assertLess(bell(7), 1.0)
 
+    def test_factory_matches_scalar(self):
+        """Test that factory-made functions agree with the general functions."""
+        cases = [
+            ('triangular', triangular_membership, dict(a=3, b=5, c=7)),
+            ('triangular', triangular_membership, dict(a=5, b=5, c=5)),
+            ('trapezoidal', trapezoidal_membership, dict(a=0, b=0, c=25, d=35)),
+            ('gaussian', gaussian_membership, dict(mean=10, sigma=2)),
+            ('gaussian', gaussian_membership, dict(mean=10, sigma=0)),
+            ('sigmoid', sigmoid_membership, dict(a=-0.5, c=5)),
+            ('bell', bell_membership, dict(a=2, b=1.5, c=5)),
+            ('bell', bell_membership, dict(a=0, b=2, c=5)),
+        ]
+        for func_type, scalar_fn, params in cases:
+            fn = create_membership_function(func_type, **params)
+            for x in [-10, 0, 2.5, 3, 5, 7, 9.75, 10, 40]:
+                with self.subTest(func_type=func_type, params=params, x=x):
+                    self.assertAlmostEqual(fn(x), scalar_fn(x, **params), places=12)
+
+    def test_factory_non_finite(self):
+        """Test factory-made functions with infinite and NaN parameters and inputs."""
+        for b in (float("inf"), float("nan")):
+            with self.subTest(b=b):
+                fn = create_membership_function('bell', a=2, b=b, c=5)
+                for x in (4.0, 5.0, 8.0):
+                    np.testing.assert_equal(fn(x), bell_membership(x, 2, b, 5))
+        sig = create_membership_function('sigmoid', a=1, c=5)
+        self.assertTrue(math.isnan(sig(float("nan"))))
+        self.assertTrue(math.isnan(sigmoid_membership(float("nan"), 1, 5)))
+
+    def test_factory_array_input(self):
+        """Test that factory-made Gaussian and sigmoid functions accept arrays."""
+        x = np.array([-1000.0, 0.0, 5.0, 10.0, 1000.0])
+        for func_type, params in [('gaussian', dict(mean=10, sigma=2)),
+                                  ('sigmoid', dict(a=1, c=5)),
+                                  ('sigmoid', dict(a=-1, c=5))]:
+            with self.subTest(func_type=func_type, params=params):
+                fn = create_membership_function(func_type, **params)
+                np.testing.assert_allclose(fn(x), fn.vectorized(x))
+
     def test_invalid_function_type(self):
         """Test that invalid function type raises error."""
         with self.assertRaises(ValueError):
@@ -357,6 +580,45 @@ class TestMembershipFunctionIntegration(unittest.TestCase):
         self.assertLess(middle_aged(age), 0.2)  # Not middle-aged
         self.assertGreater(old(age), 0.6)  # Clearly old (adjusted threshold)
 
+    def test_age_categories_vectorized(self):
+        """Test scoring an array of ages against all categories at once."""
+        categories = [
+            create_membership_function('trapezoidal', a=0, b=0, c=25, d=35),
+            create_membership_function('gaussian', mean=45, sigma=10),
+            create_membership_function('sigmoid', a=0.1, c=65),
+        ]
+        ages = np.array([20, 45, 70])
+        scores = np.stack([category.vectorized(ages) for category in categories])
+        self.assertEqual(scores.shape, (3, 3))
+        expected = [[category(age) for age in ages.tolist()] for category in categories]
+        np.testing.assert_allclose(scores, expected)
+        # Each age scores highest in its own category
+        np.testing.assert_array_equal(scores.argmax(axis=0), [0, 1, 2])
+
+    def test_age_categories_batch(self):
+        """Test scoring a large batch of ages, past the parallel threshold."""
+        categories = [
+            create_membership_function('trapezoidal', a=0, b=0, c=25, d=35),
+            create_membership_function('triangular', a=25, b=45, c=65),
+            create_membership_function('sigmoid', a=0.1, c=65),
+            lambda age: 1.0 if age >= 100 else 0.0,  # No vectorized form
+        ]
+        ages = np.linspace(0, 110, 10_000)
+        scores = score_categories(ages, *categories)
+        self.assertEqual(scores.shape, (4, 10_000))
+        expected = [[category(age) for age in ages.tolist()] for category in categories]
+        np.testing.assert_allclose(scores, expected)
+        # Any iterable of values is accepted
+        np.testing.assert_allclose(score_categories(ages.tolist()[:10], *categories),
+                                   scores[:, :10])
+
+    def test_score_categories_vectorized_flag(self):
+        """Test that a `vectorized = True` flag is not mistaken for an array version."""
+        def adult(age):
+            return 1.0 if age >= 18 else 0.0
+        adult.vectorized = True
+        np.testing.assert_array_equal(score_categories([10, 20], adult), [[0.0, 1.0]])
+
     def test_temperature_control(self):
         """Test temperature control with fuzzy membership."""
         # Temperature categories
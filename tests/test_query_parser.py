@@ -76,6 +76,10 @@ class TestFuzzyQueryParser(unittest.TestCase):
         # Regex
         result = self.parser.parse("(regex? :phone \"^\\d{3}-\\d{4}$\")")
         self.assertEqual(result, ["regex?", ":phone", "^\\d{3}-\\d{4}$"])
+        
+        # Backslashes are kept verbatim, not decoded as escapes
+        result = self.parser.parse(r"""(regex? :path "C:\\new\temp" '\n')""")
+        self.assertEqual(result, ["regex?", ":path", r"C:\\new\temp", r"\n"])
     
     def test_parse_field_accessors(self):
         """Test parsing field accessors."""
@@ -155,6 +159,19 @@ class TestFuzzyQueryParser(unittest.TestCase):
         # Empty input
         result = self.parser.parse("")
         self.assertEqual(result, [])
+        
+        # Stray closing paren
+        with self.assertRaises(SyntaxError):
+            self.parser.parse(") (>= :age 25)")
+    
+    def test_parse_deeply_nested(self):
+        """Test parsing nesting deeper than the recursion limit."""
+        depth = 5000
+        result = self.parser.parse("(not " * depth + "(>= :age 25)" + ")" * depth)
+        for _ in range(depth):
+            self.assertEqual(result[0], "not")
+            result = result[1]
+        self.assertEqual(result, [">=", ":age", 25])
 
 
 class TestFuzzyQueryFormatter(unittest.TestCase):
@@ -266,6 +283,15 @@ class TestUtilityFunctions(unittest.TestCase):
         result = parse_fuzzy_query("(>= :age 25)")
         self.assertEqual(result, [">=", ":age", 25])
     
+    def test_parse_fuzzy_query_cache(self):
+        """Test that mutating a parsed AST does not leak into later parses."""
+        result = parse_fuzzy_query("(and (>= :age 25) (< :age 65))")
+        result[1].append("extra")
+        result.append("extra")
+        self.assertEqual(parse_fuzzy_query("(and (>= :age 25) (< :age 65))"),
+                         ["and", [">=", ":age", 25], ["<", ":age", 65]])
+        self.assertEqual(parse_fuzzy_query(""), [])
+    
     def test_format_fuzzy_query(self):
         """Test the convenience format function."""
         result = format_fuzzy_query([">=", ":age", 25])
@@ -283,6 +309,29 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertFalse(valid)
         self.assertIn("Missing closing parenthesis", error)
     
+    def test_validate_long_queries(self):
+        """Test validation of queries long enough for the byte scan."""
+        clauses = " ".join(f"(>= :age {i})" for i in range(50))
+        valid, error = validate_query_syntax(f"(and {clauses}")
+        self.assertFalse(valid)
+        self.assertIn("Missing closing parenthesis", error)
+        
+        # Parentheses inside strings are not counted
+        valid, error = validate_query_syntax(f'(and {clauses} (contains? :name "a(b"))')
+        self.assertTrue(valid)
+        self.assertEqual(error, "")
+        
+        valid, error = validate_query_syntax(f"(and {clauses}) (>= :age 1)")
+        self.assertFalse(valid)
+        self.assertIn("Unexpected tokens", error)
+    
+    def test_validate_non_string(self):
+        """Test that validation reports, rather than raises, on non-strings."""
+        for query in (None, 123, b"(>= :age 25" * 30):
+            valid, error = validate_query_syntax(query)
+            self.assertFalse(valid)
+            self.assertTrue(error.startswith("Unexpected error"))
+    
     def test_convert_field_shortcuts(self):
         """Test field shortcut conversion."""
         # Colon shortcut
@@ -311,6 +360,11 @@ class TestFuzzyQueryBuilder(unittest.TestCase):
         query = q.gte("age", 25).build()
         
         self.assertEqual(query, [">=", ":age", 25])
+        
+        # State lives in slots only
+        self.assertFalse(hasattr(q, "__dict__"))
+        with self.assertRaises(AttributeError):
+            q.extra = 1
     
     def test_and_query(self):
         """Test building an AND query."""